@@ -6,16 +6,21 @@ import random
 import re
 from typing import Optional, Dict, Any, List
 from functools import wraps
+from itertools import chain, islice
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from src.vendors.web_automation.selenium_helper import SeleniumHelper, get_default_selenium_config
 from src.foundation.logging import get_logger
-from src.foundation.http_client import default_http_client
+from src.foundation.http_client import HTTPClient, default_http_client
 from src.foundation.exceptions import BusinessError, APIResponseError, APITimeoutError
 from src.toolbox.text_utils import is_advertisement_content, is_low_quality_content
 from src.toolbox.web_automation_utils import handle_web_automation_errors
@@ -23,6 +28,363 @@ from .models import BlogCredentials, BlogPlatform, LoginStatus
 
 logger = get_logger("blog_automation.adapters")
 
+# 본문 해시태그 패턴 (#한글영숫자)
+_HASHTAG_RE = re.compile(r'#([가-힣a-zA-Z0-9_]+)')
+
+# 링크 도메인 추출 패턴 (href는 스킴으로 시작)
+_DOMAIN_RE = re.compile(r'https?://([^/]+)')
+
+# Selenium 구조 분석용 본문 HTML 추출 스크립트
+# (메인 컨테이너가 없으면 최상위 se-component들만 이어붙여 중첩 컴포넌트 중복 방지)
+_CONTENT_HTML_JS = """
+const main = document.querySelector('.se-main-container');
+if (main) return main.outerHTML;
+return Array.from(document.querySelectorAll('.se-component'))
+    .filter(c => !c.parentElement || !c.parentElement.closest('.se-component'))
+    .map(c => c.outerHTML)
+    .join('');
+"""
+
+# 페이지 하단 스크롤 스크립트 (비동기: 스크롤 → 렌더링 대기 → 재스크롤 → 최종 높이 반환)
+# requestAnimationFrame으로 실제 렌더링 이후까지 기다린 뒤 지연 로딩 여유시간만 추가
+_SMOOTH_SCROLL_JS = """
+const done = arguments[arguments.length - 1];
+window.scrollTo(0, document.body.scrollHeight);
+requestAnimationFrame(() => setTimeout(() => {
+    window.scrollTo(0, document.body.scrollHeight);
+    requestAnimationFrame(() => setTimeout(() => done(document.body.scrollHeight), 150));
+}, 200));
+"""
+
+# 단순 선택자 판별 (#id / .class / tag 단독 형태)
+_SIMPLE_ID_RE = re.compile(r'#[\w-]+')
+_SIMPLE_CLASS_RE = re.compile(r'\.[\w-]+')
+_SIMPLE_TAG_RE = re.compile(r'[a-zA-Z][\w-]*')
+
+# 블로그 에디터 iframe 판별 키워드 (src/name/id 대상, 대소문자 무시)
+_EDITOR_IFRAME_RE = re.compile(r'blog\.naver\.com|editor|postwriteform|write', re.IGNORECASE)
+
+# 에디터 후보 iframe 스캔 스크립트 (문서 순서대로 후보 요소와 식별 속성 반환)
+# arguments[0]: _EDITOR_IFRAME_RE.pattern (판별 기준을 Python 쪽과 공유)
+_EDITOR_IFRAME_SCAN_JS = """
+const re = new RegExp(arguments[0], 'i');
+return Array.from(document.querySelectorAll('iframe'))
+    .map((f, index) => ({element: f, index: index,
+                         src: f.src || '', name: f.name || '', id: f.id || ''}))
+    .filter(c => re.test(c.src) || re.test(c.name) || re.test(c.id));
+"""
+
+# HTTP 요청 공통 브라우저 헤더
+_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 네이버 블로그 검색 기본 URL / 고정 파라미터
+_BLOG_SEARCH_URL = "https://search.naver.com/search.naver"
+_BLOG_SEARCH_PARAMS = {'ssc': 'tab.blog.all', 'sm': 'tab_jum'}
+
+# 검색 결과 URL 호스트 필터 (네이버 블로그만 허용, 광고 리다이렉트 제외)
+_BLOG_HOSTS = frozenset({'blog.naver.com', 'm.blog.naver.com'})
+_AD_HOSTS = frozenset({'ader.naver.com'})
+
+# 블로그 검색 결과 페이지별 start 오프셋 (페이지당 10개 기준, 최대 3페이지)
+_SEARCH_PAGE_STARTS = (1, 11, 21)
+
+# 블로그 검색 결과 제목/URL 일괄 추출 스크립트 (div.title_area 내 첫 번째 제목 링크)
+_SEARCH_TITLE_LINKS_JS = """
+return Array.from(document.querySelectorAll('div.title_area'))
+    .map(area => area.querySelector('a.title_link'))
+    .filter(a => a)
+    .map(a => ({title: a.innerText.trim(), url: a.href}));
+"""
+
+# Selenium 제목 추출 선택자 (우선순위 순: 스마트에디터 제목 모듈 → 구 에디터 → 일반 헤딩)
+_SELENIUM_TITLE_SELECTORS = (
+    '.se-module.se-module-text.se-title-text',
+    'h3.se-title-text',  # 스마트에디터 3.0
+    '.se-title-text',
+    'h2.htitle',  # 구 에디터
+    '.blog-title',
+    'h1', 'h2', 'h3',
+)
+
+# 선택자 목록 중 텍스트가 있는 첫 요소의 [선택자, 텍스트] 반환 (없으면 null)
+_FIRST_TEXT_JS = """
+for (const selector of arguments[0]) {
+    const el = document.querySelector(selector);
+    if (!el) continue;
+    const text = (el.textContent || el.innerText || '').trim();
+    if (text) return [selector, text];
+}
+return null;
+"""
+
+# 요소 스크롤 후 클릭 스크립트 (비동기: 스크롤 → 다음 프레임에서 클릭 → 클릭 여부 반환)
+# arguments[1]이 true면 화면에 표시된 요소만 클릭
+_SCROLL_CLICK_JS = """
+const el = arguments[0];
+const done = arguments[arguments.length - 1];
+if (arguments[1] && !(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+    done(false);
+    return;
+}
+el.scrollIntoView({block: 'center'});
+requestAnimationFrame(() => {
+    try {
+        el.click();
+        done(true);
+    } catch (e) {
+        done(false);
+    }
+});
+"""
+
+# 텍스트 기반 버튼 XPath (작성 중인 글 팝업 취소 / 발행)
+_DRAFT_CANCEL_BUTTON_XPATH = "//button[contains(., '취소')]"
+_PUBLISH_BUTTON_XPATH = (
+    "//button[contains(., '발행') or contains(., '게시') or contains(., '등록')]"
+    " | //input[@type='button' or @type='submit']"
+    "[contains(@value, '발행') or contains(@value, '게시') or contains(@value, '등록')]"
+)
+
+# 텍스트로 취급하지 않는 태그 (BeautifulSoup get_text()도 이 태그들의 내용은 제외)
+_SCRIPT_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+# 본문 텍스트 fallback 추출 시 제외할 태그
+_TEXT_IGNORE_TAGS = frozenset(('script', 'style', 'nav', 'header', 'footer', 'aside'))
+
+# 제목 후보 규칙 (우선순위 순, 선택자 표기는 로그용)
+# iframe 내부 제목 선택자는 HTTP 응답에 iframe 본문이 포함되지 않으므로 제외
+_TITLE_CANDIDATE_RULES = (
+    ('.se-title-text', lambda name, classes: 'se-title-text' in classes),  # 스마트에디터 3.0
+    ('h3.se-title-text', lambda name, classes: name == 'h3' and 'se-title-text' in classes),
+    ('.se-module.se-module-text.se-title-text',
+     lambda name, classes: 'se-title-text' in classes and 'se-module' in classes and 'se-module-text' in classes),
+    ('h2.htitle', lambda name, classes: name == 'h2' and 'htitle' in classes),  # 구 에디터
+    ('.blog-title', lambda name, classes: 'blog-title' in classes),
+    ('h1', lambda name, classes: name == 'h1'),  # 일반 헤더들
+    ('h2', lambda name, classes: name == 'h2'),
+    ('h3', lambda name, classes: name == 'h3'),
+    ('title', lambda name, classes: name == 'title'),  # 페이지 타이틀 (최후 수단)
+)
+_TITLE_CANDIDATE_TAGS = frozenset(('h1', 'h2', 'h3', 'title', 'meta'))
+_TITLE_CANDIDATE_CLASSES = frozenset(('se-title-text', 'htitle', 'blog-title'))
+_INVALID_TITLES = frozenset(('네이버 블로그', 'Naver Blog', '블로그'))
+
+# 확실한 GIF 패턴
+_DEFINITE_GIF_PATTERNS = (
+    '.gif?',       # 실제 .gif 확장자
+    '.gifv',       # gifv 포맷
+    'format=gif',  # URL 파라미터로 gif 명시
+    'type=gif',
+    '_gif.',       # 파일명에 gif 포함
+)
+
+# 네이버 블로그 특수 패턴 (실제로는 정적 이미지)
+_NAVER_IMAGE_PATTERNS = (
+    'postfiles.pstatic.net',  # 네이버 정적 이미지
+    'type=w80_blur',  # 블러 썸네일
+    'type=w773',      # 리사이즈 이미지
+    'type=w80',       # 작은 썸네일
+    '.jpeg',          # JPEG 이미지
+    '.jpg',           # JPG 이미지
+    '.png',           # PNG 이미지
+)
+
+# 패턴 테이블을 하나의 정규식 대안(alternation)으로 컴파일 (URL당 한 번의 검색)
+_GIF_RE = re.compile('|'.join(map(re.escape, _DEFINITE_GIF_PATTERNS)), re.IGNORECASE)
+_NAVER_IMG_RE = re.compile('|'.join(map(re.escape, _NAVER_IMAGE_PATTERNS)), re.IGNORECASE)
+
+def _xpath_has_class(class_name: str) -> str:
+    """CSS 클래스 선택자(.class)에 대응하는 XPath 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# HTTP 본문 분석용 사전 컴파일 XPath (괄호 안은 대응하는 CSS 선택자)
+_MAIN_FRAME_XPATH = etree.XPath(".//iframe[@id='mainFrame']")  # iframe#mainFrame
+_TEXT_MODULES_XPATH = etree.XPath(  # .se-module.se-module-text:not(.se-title-text):not(.se-caption)
+    f".//*[{_xpath_has_class('se-module')} and {_xpath_has_class('se-module-text')}"
+    f" and not({_xpath_has_class('se-title-text')}) and not({_xpath_has_class('se-caption')})]"
+)
+_META_DESCRIPTION_XPATH = etree.XPath(".//meta[@name='description']")
+_IMG_XPATH = etree.XPath('.//img')
+_GIF_VIDEO_XPATH = etree.XPath(f".//video[{_xpath_has_class('_gifmp4')}]")
+_SE_IMAGE_MODULE_XPATH = etree.XPath(f".//*[{_xpath_has_class('se-module')} and {_xpath_has_class('se-module-image')}]")
+_SE_VIDEO_MODULE_XPATH = etree.XPath(f".//*[{_xpath_has_class('se-module')} and {_xpath_has_class('se-module-video')}]")
+_WEBPLAYER_VIDEO_XPATH = etree.XPath(f".//*[{_xpath_has_class('webplayer-internal-source-wrapper')}]")
+_EXTERNAL_VIDEO_XPATH = etree.XPath(  # iframe[src*="youtube"], iframe[src*="vimeo"], iframe[src*="youtu.be"]
+    ".//iframe[contains(@src, 'youtube') or contains(@src, 'vimeo') or contains(@src, 'youtu.be')]"
+)
+_SE_HASHTAG_XPATH = etree.XPath(f".//span[{_xpath_has_class('__se-hash-tag')}]")
+
+# 본문 텍스트 fallback 선택자 (우선순위 순, 선택자 표기는 로그용)
+_TEXT_FALLBACK_XPATHS = (
+    ('.se-viewer', etree.XPath(f".//*[{_xpath_has_class('se-viewer')}]")),
+    ('#post_view', etree.XPath(".//*[@id='post_view']")),
+    ('.post_content', etree.XPath(f".//*[{_xpath_has_class('post_content')}]")),
+    ('.se-main-container', etree.XPath(f".//*[{_xpath_has_class('se-main-container')}]")),
+    ('.blog2_series', etree.XPath(f".//*[{_xpath_has_class('blog2_series')}]")),
+    ('body', etree.XPath('.//body')),  # 최후 수단
+)
+
+# 컴포넌트 분석용 사전 컴파일 XPath (키는 분석기에서 쓰는 CSS 선택자 표기)
+_COMPONENT_XPATHS = {
+    '.se-main-container': etree.XPath(f".//*[{_xpath_has_class('se-main-container')}]"),
+    '.se-component': etree.XPath(f".//*[{_xpath_has_class('se-component')}]"),
+    '.se-fs, .se-text-paragraph, p, h1, h2, h3, h4, h5, h6': etree.XPath(
+        f".//*[{_xpath_has_class('se-fs')} or {_xpath_has_class('se-text-paragraph')}"
+        " or self::p or self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6]"
+    ),
+    'img': etree.XPath('.//img'),
+    'iframe': etree.XPath('.//iframe'),
+    'video': etree.XPath('.//video'),
+    'tr': etree.XPath('.//tr'),
+    ':scope > th, :scope > td': etree.XPath('./*[self::th or self::td]'),
+    'a': etree.XPath('.//a'),
+    '.se-oglink-title, .se-text-title': etree.XPath(
+        f".//*[{_xpath_has_class('se-oglink-title')} or {_xpath_has_class('se-text-title')}]"
+    ),
+    '.se-oglink-summary, .se-text-summary': etree.XPath(
+        f".//*[{_xpath_has_class('se-oglink-summary')} or {_xpath_has_class('se-text-summary')}]"
+    ),
+}
+
+# 블로그 검색 결과의 제목 링크 (div.title_area 마다 첫 번째 a.title_link)
+_SEARCH_TITLE_LINK_XPATH = etree.XPath(
+    f"//div[{_xpath_has_class('title_area')}]/descendant::a[{_xpath_has_class('title_link')}][1]"
+)
+
+
+def _blog_search_url(keyword: str, start: int = 1) -> str:
+    """네이버 블로그 검색 URL 생성 (쿼리 인코딩은 urlencode에 위임, 1페이지는 start 생략)"""
+    params = {**_BLOG_SEARCH_PARAMS, 'query': keyword}
+    if start > 1:
+        params['start'] = start
+    return f"{_BLOG_SEARCH_URL}?{urlencode(params)}"
+
+
+def _selector_locator(selector: str) -> tuple:
+    """단순 CSS 선택자를 전용 탐색 방식으로 분류 (#id → ID, .class → CLASS_NAME, tag → TAG_NAME)"""
+    if _SIMPLE_ID_RE.fullmatch(selector):
+        return By.ID, selector[1:]
+    if _SIMPLE_CLASS_RE.fullmatch(selector):
+        return By.CLASS_NAME, selector[1:]
+    if _SIMPLE_TAG_RE.fullmatch(selector):
+        return By.TAG_NAME, selector
+    return By.CSS_SELECTOR, selector
+
+
+# 발행 버튼 탐색 순서 (By, 값, 표시된 요소만 클릭 여부) - 단순 선택자는 import 시 ID/CLASS_NAME으로 분류
+_PUBLISH_SELECTORS = (
+    (By.XPATH, _PUBLISH_BUTTON_XPATH, False),  # 텍스트 기반 (발행/게시/등록)
+) + tuple((*_selector_locator(selector), True) for selector in (
+    ".btn_publish",  # 클래스 기반
+    "#publish",  # ID 기반
+    "[value='발행']",  # value 속성 기반
+    "input[type='submit'][value*='발행']",  # submit 버튼
+    ".publish_btn",  # 발행 버튼 클래스
+    "button[onclick*='publish']",  # onclick 속성 기반
+    ".btn_area button:last-child",  # 버튼 영역의 마지막 버튼 (보통 발행)
+))
+
+
+def _join_bounded(pieces, limit: int) -> tuple:
+    """텍스트 조각을 limit 글자까지만 이어붙이고 전체 길이는 조각 길이 합으로 계산"""
+    kept = []
+    kept_length = 0
+    total_length = 0
+    for piece in pieces:
+        total_length += len(piece)
+        if kept_length < limit:
+            kept.append(piece)
+            kept_length += len(piece)
+    return ''.join(kept)[:limit], total_length
+
+
+def _html_parser(encoding: str = None):
+    """본문 분석용 HTML 파서 (libxml2 기본 중첩 깊이 제한에 걸려 깊은 마크업이 잘리지 않도록 huge_tree 사용)"""
+    # 파서 인스턴스는 병렬 분석 스레드 간에 공유하지 않도록 호출마다 생성
+    return lxml_html.HTMLParser(huge_tree=True, encoding=encoding)
+
+
+def _parse_html_response(response):
+    """HTTP 응답 본문을 lxml 문서 트리로 파싱 (빈 본문은 빈 문서로 처리)"""
+    # str 본문은 XML 인코딩 선언이 있으면 파싱 불가하므로 bytes + 감지된 응답 인코딩으로 파싱
+    try:
+        return lxml_html.document_fromstring(response.content, parser=_html_parser(response.encoding))
+    except etree.ParserError:
+        # 빈 문서 (Document is empty) - 이후 분석 단계는 빈 결과로 진행
+        return lxml_html.Element('html')
+
+
+def _iter_lxml_strings(element, skip_tags: frozenset, skip_class: str = None):
+    """element 하위 텍스트 조각을 문서 순서대로 생성 (skip_tags/skip_class 하위와 주석은 제외, 꼬리 텍스트는 유지)"""
+    if element.text:
+        yield element.text
+    # 깊게 중첩된 마크업에서도 RecursionError가 나지 않도록 (자식 반복자, 닫힌 뒤 이어질 꼬리 텍스트) 스택으로 순회
+    stack = [(iter(element), None)]
+    while stack:
+        children, tail = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if tail:
+                yield tail
+        elif (not isinstance(child.tag, str) or child.tag in skip_tags
+              or (skip_class and skip_class in (child.get('class') or '').split())):
+            # 주석/처리명령/제외 태그는 내용을 건너뛰고 뒤따르는 텍스트만 수집
+            if child.tail:
+                yield child.tail
+        else:
+            if child.text:
+                yield child.text
+            stack.append((iter(child), child.tail))
+
+
+def _element_text(element) -> str:
+    """BeautifulSoup get_text(strip=True)와 동일한 텍스트 (script/style/template 내용 제외)"""
+    return ''.join(piece.strip() for piece in _iter_lxml_strings(element, _SCRIPT_TEXT_TAGS))
+
+
+class _LxmlAdapter:
+    """lxml Element 접근 어댑터 (se-component 분석용, 사전 컴파일 XPath 사용)"""
+    
+    def text(self, element) -> str:
+        return _element_text(element)
+    
+    def text_bounded(self, element, limit: int) -> tuple:
+        return _join_bounded((piece.strip() for piece in _iter_lxml_strings(element, _SCRIPT_TEXT_TAGS)), limit)
+    
+    def find(self, parent, selector):
+        found = _COMPONENT_XPATHS[selector](parent)
+        return found[0] if found else None
+    
+    def find_all(self, parent, selector) -> list:
+        return _COMPONENT_XPATHS[selector](parent)
+    
+    def attr(self, element, name: str) -> str:
+        return element.get(name) or ''
+    
+    def classes(self, element) -> list:
+        return (element.get('class') or '').split()
+    
+    def tag(self, element) -> str:
+        return element.tag
+    
+    def html_preview(self, element, limit: int = 200) -> str:
+        # lxml 직렬화는 C 레벨에서 처리되므로 결과 문자열만 잘라서 사용
+        html_str = etree.tostring(element, encoding='unicode', with_tail=False)
+        return html_str[:limit] + '...' if len(html_str) > limit else html_str
+
+
+# 어댑터 싱글톤 (상태 없음)
+_LXML_ADAPTER = _LxmlAdapter()
+
 
 class NaverBlogAdapter:
     """네이버 블로그 자동화 어댑터"""
@@ -35,17 +397,40 @@ class NaverBlogAdapter:
         self.is_logged_in = False
         self.two_factor_auth_detected = False
         self.username = None  # 로그인한 사용자 아이디 저장
+        self._browser_started = False  # 브라우저 기동 여부 (분석 전용 브라우저 지연 시작용)
 
         # 네이버 블로그 URL들
         self.main_url = "https://section.blog.naver.com/"
         self.login_start_url = "https://nid.naver.com/nidlogin.login"  # 직접 로그인 페이지로 시작
         self.blog_home_url = "https://section.blog.naver.com/BlogHome.naver?directoryNo=0&currentPage=1&groupId=0"
+
+        # 네이버 검색 전용 HTTP 세션 (keep-alive 재사용, 빠른 실패 후 Selenium 폴백)
+        self._search_http = HTTPClient(timeout=10.0, max_retries=2, backoff_factor=0.3, pool_maxsize=8)
+        self._search_http.session.headers.update(_HTTP_HEADERS)
+
+        # se-component 클래스 -> (우선순위, 분석기) 라우팅 테이블
+        self._component_analyzers = {
+            'se-text': (1, self._analyze_text_component_unified),                      # 텍스트 (단락/헤딩)
+            'se-image': (2, self._analyze_image_component_unified),                    # 이미지 (단일)
+            'se-imageGroup': (3, self._analyze_gallery_component_unified),             # 갤러리 (다중 이미지)
+            'se-image-group': (3, self._analyze_gallery_component_unified),
+            'se-video': (4, self._analyze_video_component_unified),                    # 비디오
+            'se-quotation': (5, self._analyze_quotation_component_unified),            # 인용문
+            'se-table': (6, self._analyze_table_component_unified),                    # 표
+            'se-horizontalLine': (7, self._analyze_horizontal_line_component_unified), # 구분선
+            'se-horizontal-line': (7, self._analyze_horizontal_line_component_unified),
+            'se-sticker': (8, self._analyze_sticker_component_unified),                # 스티커
+            'se-oembed': (9, self._analyze_oembed_component_unified),                  # 외부 임베드 (OEmbed)
+            'se-oglink': (10, self._analyze_oglink_component_unified),                 # 외부 링크 프리뷰 (OG Link)
+            'se-imageStrip': (11, self._analyze_image_strip_component_unified),        # 이미지 스트립/슬라이더
+        }
     
     @handle_web_automation_errors("브라우저 시작")
     def start_browser(self, for_login=True):
         """브라우저 시작"""
         logger.info("네이버 블로그 브라우저 시작")
         self.helper.initialize()
+        self._browser_started = True
         
         if for_login:
             # 로그인용: 직접 네이버 로그인 페이지로 이동
@@ -64,12 +449,14 @@ class NaverBlogAdapter:
         try:
             logger.info("네이버 블로그 브라우저 종료 중...")
             self.helper.cleanup()
+            self._browser_started = False
             self.is_logged_in = False
             self.two_factor_auth_detected = False
             logger.info("브라우저 종료 완료")
             
         except Exception as e:
             logger.error(f"브라우저 종료 중 오류: {e}")
+            self._browser_started = False
             self.is_logged_in = False
             self.two_factor_auth_detected = False
     
@@ -90,6 +477,41 @@ class NaverBlogAdapter:
         
         return None, None
     
+    @contextmanager
+    def _implicit_wait_disabled(self):
+        """블록 실행 동안 implicit wait 해제 (종료 시 설정값으로 복원)"""
+        driver = self.helper.driver
+        driver.implicitly_wait(0)
+        try:
+            yield driver
+        finally:
+            driver.implicitly_wait(self.helper.config.implicit_wait)
+    
+    def _find_elements_now(self, by, selector) -> list:
+        """implicit wait 없이 즉시 요소 검색 (없으면 빈 리스트)"""
+        with self._implicit_wait_disabled() as driver:
+            return driver.find_elements(by, selector)
+    
+    def _wait_for_url_change(self, old_url: str, timeout: float = 2) -> bool:
+        """클릭 후 페이지 이동 대기 (이동하지 않는 레이어 발행은 timeout까지만 대기)"""
+        try:
+            WebDriverWait(self.helper.driver, timeout).until(EC.url_changes(old_url))
+            return True
+        except TimeoutException:
+            logger.debug("URL 변경 대기 타임아웃 - 계속 진행")
+            return False
+    
+    def _wait_for_search_results(self, timeout: float = 5) -> bool:
+        """블로그 검색 결과 제목 링크가 나타날 때까지 대기"""
+        try:
+            WebDriverWait(self.helper.driver, timeout).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.title_area a.title_link"))
+            )
+            return True
+        except TimeoutException:
+            logger.debug("검색 결과 로딩 대기 타임아웃 - 계속 진행")
+            return False
+    
     def _wait_and_click_element(self, selectors, timeout=10):
         """여러 셀렉터를 시도하여 요소 클릭 (중복 코드 제거용 헬퍼)"""
         element, used_selector = self._wait_and_find_element(selectors, timeout)
@@ -781,7 +1203,7 @@ class NaverBlogAdapter:
             logger.info(f"🌐 Selenium 블로그 검색 시작: {keyword} (최대 {max_results}개)")
             
             # 분석 전용 브라우저 시작 (초기화되지 않은 경우)
-            if not hasattr(self.helper, 'driver') or not self.helper.driver:
+            if not self._browser_started or not getattr(self.helper, 'driver', None):
                 logger.info("🔧 분석 전용 브라우저 시작")
                 self.start_browser_for_analysis()
             
@@ -807,10 +1229,7 @@ class NaverBlogAdapter:
     def _search_blogs_via_selenium(self, keyword: str, max_results: int = 3) -> list:
         """Selenium으로 블로그 검색 (기존 방식)"""
         try:
-            # URL 인코딩
-            import urllib.parse
-            encoded_keyword = urllib.parse.quote(keyword)
-            search_url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&sm=tab_jum&query={encoded_keyword}"
+            search_url = _blog_search_url(keyword)
             
             logger.info(f"Selenium 검색 URL: {search_url}")
             
@@ -922,34 +1341,15 @@ class NaverBlogAdapter:
             
             # 제목 추출 (스마트에디터 모듈 우선)
             try:
-                # 1. 스마트에디터 3.0 제목 모듈에서 추출
-                title_module = self.helper.find_element('.se-module.se-module-text.se-title-text')
-                if title_module:
-                    title_text = title_module.get_attribute('textContent') or title_module.text or ''
-                    clean_title = ' '.join(title_text.split())  # 공백 정리
-                    if clean_title:
-                        analysis_result['title'] = clean_title
+                # 스마트에디터 제목 모듈 → fallback 선택자 순으로 브라우저에서 한 번에 탐색
+                found = self.helper.driver.execute_script(_FIRST_TEXT_JS, _SELENIUM_TITLE_SELECTORS)
+                if found:
+                    selector, title_text = found
+                    analysis_result['title'] = ' '.join(title_text.split())  # 공백 정리
+                    if selector == _SELENIUM_TITLE_SELECTORS[0]:
                         logger.info(f"스마트에디터 제목 추출: {analysis_result['title']}")
-                
-                # 2. fallback 선택자들
-                if not analysis_result['title']:
-                    title_selectors = [
-                        'h3.se-title-text',  # 스마트에디터 3.0
-                        '.se-title-text',
-                        'h2.htitle',  # 구 에디터
-                        '.blog-title',
-                        'h1', 'h2', 'h3'
-                    ]
-                    
-                    for selector in title_selectors:
-                        title_element = self.helper.find_element(selector)
-                        if title_element:
-                            title_text = title_element.get_attribute('textContent') or title_element.text or ''
-                            clean_title = ' '.join(title_text.split())
-                            if clean_title:
-                                analysis_result['title'] = clean_title
-                                logger.info(f"Fallback 제목 추출: {analysis_result['title']} - {selector}")
-                                break
+                    else:
+                        logger.info(f"Fallback 제목 추출: {analysis_result['title']} - {selector}")
                                 
             except Exception as e:
                 logger.debug(f"제목 추출 실패: {e}")
@@ -1159,14 +1559,7 @@ class NaverBlogAdapter:
             logger.info(f"HTTP 기반 블로그 분석 시작: {blog_url}")
             
             # HTTP 요청으로 페이지 컨텐츠 가져오기 (foundation HTTP 클라이언트 사용)
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            headers = _HTTP_HEADERS
             
             # 향상된 HTTP 클라이언트로 여러 URL 시도 (PostView URL + 원본 URL)
             urls_to_try = []
@@ -1189,15 +1582,16 @@ class NaverBlogAdapter:
             
             logger.info(f"HTTP 요청 성공: {response.status_code} - {len(response.text)} bytes")
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # HTML 파싱 (제목/본문/미디어/태그/구조 분석 모두 이 lxml 트리 하나를 공유)
+            root = _parse_html_response(response)
             logger.info(f"HTML 파싱 완료")
             
             # iframe 확인 및 실제 콘텐츠 페이지 추출
-            content_soup = None
-            iframe = soup.select_one('iframe#mainFrame')
+            content_root = None
+            frames = _MAIN_FRAME_XPATH(root)
+            iframe = frames[0] if frames else None
             
-            if iframe:
+            if iframe is not None:
                 iframe_src = iframe.get('src', '')
                 if iframe_src:
                     # 상대 URL을 절대 URL로 변환
@@ -1212,7 +1606,7 @@ class NaverBlogAdapter:
                         # iframe 내부 콘텐츠 요청 (인코딩 자동 감지 포함)
                         iframe_response = default_http_client.get_with_encoding_detection(iframe_url, headers=headers)
                         if iframe_response.status_code == 200:
-                            content_soup = BeautifulSoup(iframe_response.text, 'html.parser')
+                            content_root = _parse_html_response(iframe_response)
                             logger.info(f"iframe 콘텐츠 로드 성공: {len(iframe_response.text)} bytes")
                         else:
                             logger.warning(f"iframe 요청 실패: {iframe_response.status_code}")
@@ -1226,8 +1620,9 @@ class NaverBlogAdapter:
                     except Exception as iframe_error:
                         logger.warning(f"iframe 요청 오류: {iframe_error}")
             
-            # 실제 분석할 soup 결정 (iframe 콘텐츠가 있으면 그것을, 없으면 원본)
-            analysis_soup = content_soup if content_soup else soup
+            # 실제 분석할 트리 결정 (iframe 콘텐츠가 있으면 그것을, 없으면 원본)
+            # lxml 요소의 진리값은 자식 유무이므로 None과 직접 비교
+            analysis_root = content_root if content_root is not None else root
             
             analysis_result = {
                 'url': blog_url,
@@ -1242,20 +1637,20 @@ class NaverBlogAdapter:
             }
             
             # 제목 추출 (원본 페이지에서 먼저, iframe에서 보완)
-            title = self._extract_title_http(soup)
+            title = self._extract_title_http(root)
             if not title or title == '제목 없음':
-                title = self._extract_title_http(analysis_soup)
+                title = self._extract_title_http(analysis_root)
             analysis_result['title'] = title
             logger.info(f"HTTP 제목 추출: {title}")
             
             # 본문 텍스트 추출 및 길이 계산 (iframe 콘텐츠에서)
-            text_content, content_length = self._extract_text_content_http(analysis_soup)
+            text_content, content_length = self._extract_text_content_http(analysis_root)
             analysis_result['text_content'] = text_content  # 전체 텍스트 사용 (정보요약 AI를 위해)
             analysis_result['content_length'] = content_length
             logger.info(f"HTTP 본문 글자수: {content_length}")
             
             # 콘텐츠 구조 분석 (iframe 콘텐츠에서)
-            content_structure = self._extract_content_structure_http(analysis_soup)
+            content_structure = self._extract_content_structure_http(analysis_root)
             analysis_result['content_structure'] = content_structure
             logger.info(f"HTTP 콘텐츠 구조: {len(content_structure)}개 요소")
             
@@ -1263,7 +1658,7 @@ class NaverBlogAdapter:
             image_count, gif_count, video_count = self._count_media_from_structure(content_structure)
             
             # 기존 방식도 참고 (비교용)
-            legacy_image_count, legacy_gif_count, legacy_video_count = self._count_media_http(analysis_soup)
+            legacy_image_count, legacy_gif_count, legacy_video_count = self._count_media_http(analysis_root)
             logger.debug(f"구조 기반: 이미지={image_count}, GIF={gif_count}, 비디오={video_count}")
             logger.debug(f"Legacy 기반: 이미지={legacy_image_count}, GIF={legacy_gif_count}, 비디오={legacy_video_count}")
             
@@ -1286,7 +1681,7 @@ class NaverBlogAdapter:
             
             # HTTP 분석: HTML과 본문 텍스트에서 해시태그 패턴 추출
             logger.info("HTTP 분석: 해시태그 패턴 추출 중...")
-            content_hashtags = self._extract_content_hashtags_from_html(analysis_soup, text_content)
+            content_hashtags = self._extract_content_hashtags_from_html(analysis_root, text_content)
             analysis_result['tags'] = content_hashtags[:10]  # 최대 10개
             logger.info(f"해시태그 추출: {len(analysis_result['tags'])}개")
             
@@ -1330,37 +1725,40 @@ class NaverBlogAdapter:
             logger.error(f"PostView URL 변환 실패: {e}")
             return None
     
-    def _extract_title_http(self, soup: BeautifulSoup) -> str:
+    def _extract_title_http(self, root) -> str:
         """HTML에서 블로그 제목 추출"""
         try:
-            # 다양한 제목 선택자 시도 (우선순위 순)
-            title_selectors = [
-                # iframe 내부 제목들
-                'iframe[id*="mainFrame"] .se-title-text',
-                'iframe .se-title-text',
-                # 일반 제목들  
-                '.se-title-text',  # 스마트에디터 3.0
-                'h3.se-title-text',
-                '.se-module.se-module-text.se-title-text',
-                'h2.htitle',  # 구 에디터
-                '.blog-title',
-                'h1', 'h2', 'h3',  # 일반 헤더들
-                'title'  # 페이지 타이틀 (최후 수단)
-            ]
-            
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text(strip=True)
+            # 문서를 한 번만 순회하며 선택자별 첫 매칭 요소 수집 (select_one 반복 호출 대체)
+            first_matches = [None] * len(_TITLE_CANDIDATE_RULES)
+            meta_title = None
+            
+            for element in root.iter(etree.Element):
+                name = element.tag
+                classes = (element.get('class') or '').split()
+                if name not in _TITLE_CANDIDATE_TAGS and _TITLE_CANDIDATE_CLASSES.isdisjoint(classes):
+                    continue
+                
+                if name == 'meta':
+                    if meta_title is None and element.get('property') == 'og:title':
+                        meta_title = element
+                    continue
+                
+                for index, (_, matches) in enumerate(_TITLE_CANDIDATE_RULES):
+                    if first_matches[index] is None and matches(name, classes):
+                        first_matches[index] = element
+            
+            # 우선순위 순으로 유효한 제목 확인
+            for (selector, _), element in zip(_TITLE_CANDIDATE_RULES, first_matches):
+                if element is not None:
+                    title = _element_text(element)
                     # 유효한 제목 체크
-                    if title and len(title) > 1 and title not in ['네이버 블로그', 'Naver Blog', '블로그']:
+                    if title and len(title) > 1 and title not in _INVALID_TITLES:
                         logger.debug(f"제목 추출 성공 ({selector}): {title}")
                         return title
             
             # 메타 태그에서도 시도
-            meta_title = soup.select_one('meta[property="og:title"]')
-            if meta_title:
-                title = meta_title.get('content', '').strip()
+            if meta_title is not None:
+                title = (meta_title.get('content') or '').strip()
                 if title and title != '네이버 블로그':
                     logger.debug(f"메타 제목 추출: {title}")
                     return title
@@ -1371,41 +1769,29 @@ class NaverBlogAdapter:
             logger.debug(f"HTTP 제목 추출 실패: {e}")
             return '제목 없음'
     
-    def _extract_text_content_http(self, soup: BeautifulSoup) -> tuple:
+    def _extract_text_content_http(self, root) -> tuple:
         """HTML에서 본문 텍스트 추출 및 길이 계산"""
         try:
             total_text = ""
             
             # 스마트에디터 3.0 텍스트 모듈 추출 (제목 제외)
-            text_modules = soup.select('.se-module.se-module-text:not(.se-title-text):not(.se-caption)')
+            text_modules = _TEXT_MODULES_XPATH(root)
             
             if text_modules:
                 logger.debug(f"스마트에디터 텍스트 모듈 {len(text_modules)}개 발견")
                 for module in text_modules:
-                    module_text = module.get_text(strip=True)
+                    module_text = _element_text(module)
                     if module_text:
                         total_text += module_text + ' '
             
             # 추가 텍스트 추출 시도 (fallback)
             if not total_text.strip():
-                fallback_selectors = [
-                    '.se-viewer',
-                    '#post_view', 
-                    '.post_content',
-                    '.se-main-container',
-                    '.blog2_series',
-                    'body'  # 최후 수단
-                ]
-                
-                for selector in fallback_selectors:
-                    element = soup.select_one(selector)
-                    if element:
+                for selector, xpath in _TEXT_FALLBACK_XPATHS:
+                    found = xpath(root)
+                    if found:
                         logger.debug(f"Fallback 선택자 시도: {selector}")
-                        # 불필요한 요소들 제거
-                        for unwanted in element(['script', 'style', 'nav', 'header', 'footer', 'aside', '.sidebar']):
-                            unwanted.decompose()
-                        
-                        text_content = element.get_text(strip=True)
+                        # 불필요한 요소들은 트리 수정(decompose) 없이 건너뛰며 텍스트 수집
+                        text_content = ''.join(self._iter_visible_strings(found[0]))
                         if text_content and len(text_content) > 100:  # 최소 100자 이상
                             total_text = text_content
                             logger.debug(f"Fallback 성공: {len(text_content)}자")
@@ -1413,9 +1799,9 @@ class NaverBlogAdapter:
             
             # 메타 description도 시도 (추가 정보용)
             if not total_text.strip():
-                meta_desc = soup.select_one('meta[name="description"]')
-                if meta_desc:
-                    desc_content = meta_desc.get('content', '').strip()
+                meta_descs = _META_DESCRIPTION_XPATH(root)
+                if meta_descs:
+                    desc_content = (meta_descs[0].get('content') or '').strip()
                     if desc_content:
                         total_text = desc_content
                         logger.debug(f"메타 설명 사용: {desc_content[:50]}...")
@@ -1431,19 +1817,26 @@ class NaverBlogAdapter:
             logger.debug(f"HTTP 본문 추출 실패: {e}")
             return "", 0
     
-    def _count_media_http(self, soup: BeautifulSoup) -> tuple:
+    def _iter_visible_strings(self, element):
+        """본문 외 요소(script/style/nav/header/footer/aside/.sidebar) 하위를 제외한 텍스트 조각 (strip 적용)"""
+        for piece in _iter_lxml_strings(element, _TEXT_IGNORE_TAGS, 'sidebar'):
+            text = piece.strip()
+            if text:
+                yield text
+    
+    def _count_media_http(self, root) -> tuple:
         """HTML에서 이미지, GIF, 비디오 개수 카운트 (개선된 GIF 감지)"""
         try:
             # 1. 실제 GIF 감지 (video._gifmp4 태그)
-            gif_videos = soup.select('video._gifmp4')
+            gif_videos = _GIF_VIDEO_XPATH(root)
             gif_count = len(gif_videos)
             
             # 2. 이미지 요소들 검사
-            all_images = soup.select('img')
+            all_images = _IMG_XPATH(root)
             image_count = 0
             
             for img in all_images:
-                src = img.get('src', '')
+                src = img.get('src') or ''
                 if self._is_actual_gif(src):
                     gif_count += 1
                     logger.debug(f"Legacy GIF 감지: {src}")
@@ -1451,7 +1844,7 @@ class NaverBlogAdapter:
                     image_count += 1
             
             # 3. 스마트에디터 모듈 기반 카운트 (보조적으로)
-            se_image_modules = soup.select('.se-module.se-module-image')
+            se_image_modules = _SE_IMAGE_MODULE_XPATH(root)
             se_image_count = len(se_image_modules)
             
             # 구조 분석 결과와 비교해서 더 정확한 값 사용
@@ -1460,13 +1853,13 @@ class NaverBlogAdapter:
                 image_count = se_image_count
             
             # 4. 비디오 카운트
-            video_modules = soup.select('.se-module.se-module-video')
+            video_modules = _SE_VIDEO_MODULE_XPATH(root)
             video_count = len(video_modules)
             
             # fallback: 웹플레이어 또는 외부 동영상
             if video_count == 0:
-                webplayer_videos = soup.select('.webplayer-internal-source-wrapper')
-                external_videos = soup.select('iframe[src*="youtube"], iframe[src*="vimeo"], iframe[src*="youtu.be"]')
+                webplayer_videos = _WEBPLAYER_VIDEO_XPATH(root)
+                external_videos = _EXTERNAL_VIDEO_XPATH(root)
                 video_count = len(webplayer_videos) + len(external_videos)
             
             logger.debug(f"Legacy HTTP 미디어 카운트: 이미지={image_count}, GIF={gif_count}, 비디오={video_count}")
@@ -1476,18 +1869,18 @@ class NaverBlogAdapter:
             logger.debug(f"HTTP 미디어 카운트 실패: {e}")
             return 0, 0, 0
     
-    def _extract_content_hashtags_from_html(self, soup: BeautifulSoup, text_content: str) -> list:
+    def _extract_content_hashtags_from_html(self, root, text_content: str) -> list:
         """HTML과 본문 텍스트에서 해시태그 패턴 추출 (네이버 스마트에디터 해시태그 포함)"""
         try:
             logger.debug("해시태그 추출 시작")
             hashtags = []
             
             # 1. 네이버 스마트에디터 해시태그 클래스에서 직접 추출 (최우선)
-            se_hashtag_elements = soup.select('span.__se-hash-tag')
+            se_hashtag_elements = _SE_HASHTAG_XPATH(root)
             logger.debug(f"스마트에디터 해시태그 요소: {len(se_hashtag_elements)}개")
             
             for element in se_hashtag_elements:
-                tag_text = element.get_text(strip=True)
+                tag_text = _element_text(element)
                 if tag_text and tag_text.startswith('#') and len(tag_text) >= 3:  # 최소 #XX 형태
                     if tag_text not in hashtags:
                         hashtags.append(tag_text)
@@ -1536,58 +1929,34 @@ class NaverBlogAdapter:
             
             logger.debug(f"본문 해시태그 추출 시작: {len(text_content)} 글자")
             
-            import re
-            hashtags = []
-            
-            # 1. 기본 해시태그 패턴 (#한글영숫자)
-            basic_pattern = r'#([가-힣a-zA-Z0-9_]+)'
-            basic_matches = re.findall(basic_pattern, text_content)
-            
-            for match in basic_matches:
-                hashtag = f"#{match}"
-                if hashtag not in hashtags and len(match) >= 2:  # 최소 2글자 이상
-                    hashtags.append(hashtag)
-            
+            # 1. 기본 해시태그 패턴 (#한글영숫자) - 한 번의 스캔으로 위치 정보까지 수집
+            # 마지막 200자에서 발견된 태그는 더 정확한 태그일 가능성이 높으므로 별도 기록
+            text_len = len(text_content)
+            last_part_start = text_len - 200 if text_len > 200 else None
+            seen_tags = {}  # 등장 순서 유지용 (dict를 순서 있는 set으로 사용)
+            last_part_names = set()
+            last_part_count = 0
+            
+            for match in _HASHTAG_RE.finditer(text_content):
+                tag_name = match.group(1)
+                if last_part_start is not None and match.start() >= last_part_start:
+                    last_part_count += 1
+                    last_part_names.add(tag_name)
+                if len(tag_name) >= 2:  # 최소 2글자 이상
+                    seen_tags.setdefault(f"#{tag_name}", None)
+            
+            hashtags = list(seen_tags)
             logger.debug(f"기본 패턴 해시태그: {len(hashtags)}개")
             
-            # 2. 본문 마지막 부분에 있는 태그들 우선 처리 (더 정확한 태그일 가능성 높음)
-            # 마지막 200자에서 해시태그가 집중되어 있는지 확인
-            if len(text_content) > 200:
-                last_part = text_content[-200:]
-                last_part_hashtags = re.findall(basic_pattern, last_part)
-                
-                if len(last_part_hashtags) >= 3:  # 마지막 부분에 태그가 많으면 우선순위
-                    logger.debug(f"마지막 200자에서 {len(last_part_hashtags)}개 해시태그 발견 - 우선순위 적용")
-                    
-                    # 마지막 부분의 태그들을 앞쪽에 배치
-                    priority_tags = []
-                    remaining_tags = []
-                    
-                    for hashtag in hashtags:
-                        tag_name = hashtag[1:]  # # 제거
-                        if tag_name in last_part_hashtags:
-                            priority_tags.append(hashtag)
-                        else:
-                            remaining_tags.append(hashtag)
-                    
-                    hashtags = priority_tags + remaining_tags
-            
-            # 3. 콤마나 공백으로 구분된 연속 해시태그 패턴도 확인
-            # 예: #민생회복지원금,#지원금,#민생회복2025 또는 #민생회복지원금 #지원금 #민생회복2025
-            consecutive_pattern = r'#[가-힣a-zA-Z0-9_]+(?:[,\s]*#[가-힣a-zA-Z0-9_]+)+'
-            consecutive_matches = re.findall(consecutive_pattern, text_content)
-            
-            for match in consecutive_matches:
-                # 연속 패턴에서 개별 해시태그들 추출
-                individual_tags = re.findall(r'#([가-힣a-zA-Z0-9_]+)', match)
-                for tag in individual_tags:
-                    hashtag = f"#{tag}"
-                    if hashtag not in hashtags and len(tag) >= 2:
-                        hashtags.append(hashtag)
-            
-            logger.debug(f"연속 패턴 추가 후: {len(hashtags)}개")
+            # 2. 본문 마지막 부분에 태그가 많으면 우선순위 적용 (마지막 부분의 태그들을 앞쪽에 배치)
+            # 연속 해시태그(#a,#b #c)의 개별 태그도 위 기본 패턴에 모두 포함되므로 별도 스캔 불필요
+            if last_part_count >= 3:
+                logger.debug(f"마지막 200자에서 {last_part_count}개 해시태그 발견 - 우선순위 적용")
+                priority_tags = [tag for tag in hashtags if tag[1:] in last_part_names]
+                remaining_tags = [tag for tag in hashtags if tag[1:] not in last_part_names]
+                hashtags = priority_tags + remaining_tags
             
-            # 4. 일반적이지 않은 태그들 필터링
+            # 3. 일반적이지 않은 태그들 필터링
             filtered_hashtags = []
             
             # 제외할 패턴들 (CSS/HTML 요소, 너무 일반적이거나 의미없는 것들)
@@ -1617,7 +1986,7 @@ class NaverBlogAdapter:
             
             logger.debug(f"필터링 후 최종: {len(filtered_hashtags)}개")
             
-            # 5. 중복 제거 및 길이순 정렬 (긴 태그가 더 구체적일 가능성)
+            # 4. 중복 제거 및 길이순 정렬 (긴 태그가 더 구체적일 가능성)
             unique_hashtags = []
             for hashtag in filtered_hashtags:
                 if hashtag not in unique_hashtags:
@@ -1649,7 +2018,7 @@ class NaverBlogAdapter:
                 
                 if comp_type == 'image':
                     # 이미지인데 실제 GIF인지 정확히 확인
-                    src = component.get('attributes', {}).get('src', '')
+                    src = component.get('src', '')
                     if self._is_actual_gif(src):
                         gif_count += 1
                         logger.debug(f"GIF 감지: {src}")
@@ -1659,15 +2028,13 @@ class NaverBlogAdapter:
                 
                 elif comp_type == 'gallery':
                     # 갤러리의 이미지들 개수 추가
-                    gallery_image_count = component.get('attributes', {}).get('image_count', 0)
+                    gallery_image_count = component.get('image_count', 0)
                     
                     # 갤러리 이미지들 중 실제 GIF 확인
-                    image_urls = component.get('attributes', {}).get('image_urls', [])
-                    gallery_gif_count = 0
-                    
-                    for url in image_urls:
-                        if self._is_actual_gif(url):
-                            gallery_gif_count += 1
+                    image_urls = component.get('image_urls', ())
+                    # any()가 첫 GIF에서 멈추면 같은 이터레이터로 나머지만 집계 (GIF 없으면 image_count 그대로 신뢰)
+                    gif_flags = map(self._is_actual_gif, image_urls)
+                    gallery_gif_count = 1 + sum(gif_flags) if any(gif_flags) else 0
                     
                     gif_count += gallery_gif_count
                     image_count += (gallery_image_count - gallery_gif_count)
@@ -1682,15 +2049,13 @@ class NaverBlogAdapter:
                 
                 elif comp_type == 'image_strip':
                     # 이미지 스트립/슬라이더의 이미지들 개수 추가
-                    strip_image_count = component.get('attributes', {}).get('image_count', 0)
+                    strip_image_count = component.get('image_count', 0)
                     
                     # 스트립 이미지들 중 실제 GIF 확인
-                    image_urls = component.get('attributes', {}).get('image_urls', [])
-                    strip_gif_count = 0
-                    
-                    for url in image_urls:
-                        if self._is_actual_gif(url):
-                            strip_gif_count += 1
+                    image_urls = component.get('image_urls', ())
+                    # any()가 첫 GIF에서 멈추면 같은 이터레이터로 나머지만 집계 (GIF 없으면 image_count 그대로 신뢰)
+                    gif_flags = map(self._is_actual_gif, image_urls)
+                    strip_gif_count = 1 + sum(gif_flags) if any(gif_flags) else 0
                     
                     gif_count += strip_gif_count
                     image_count += (strip_image_count - strip_gif_count)
@@ -1712,61 +2077,36 @@ class NaverBlogAdapter:
         if not url:
             return False
         
-        url_lower = url.lower()
-        
-        # 확실한 GIF 패턴
-        definite_gif_patterns = [
-            '.gif?',  # 실제 .gif 확장자
-            '.gifv',  # gifv 포맷
-            'format=gif',  # URL 파라미터로 gif 명시
-            'type=gif',
-            '_gif.',   # 파일명에 gif 포함
-        ]
-        
-        # 네이버 블로그 특수 패턴 (실제로는 정적 이미지)
-        naver_image_patterns = [
-            'postfiles.pstatic.net',  # 네이버 정적 이미지
-            'type=w80_blur',  # 블러 썸네일
-            'type=w773',      # 리사이즈 이미지
-            'type=w80',       # 작은 썸네일
-            '.jpeg',          # JPEG 이미지
-            '.jpg',           # JPG 이미지
-            '.png',           # PNG 이미지
-        ]
-        
-        # 네이버 정적 이미지 패턴이면 GIF가 아님
-        for pattern in naver_image_patterns:
-            if pattern in url_lower:
-                return False
-        
-        # 확실한 GIF 패턴이면 GIF
-        for pattern in definite_gif_patterns:
-            if pattern in url_lower:
-                return True
+        # 네이버 정적 이미지 패턴이면 GIF가 아님, 그 외 확실한 GIF 패턴이면 GIF
+        if _NAVER_IMG_RE.search(url):
+            return False
         
-        return False
+        return _GIF_RE.search(url) is not None
     
     # =================================
     # 공통 HTML 구조 분석 (HTTP/Selenium 통합)
     # =================================
     
-    def _extract_content_structure_unified(self, soup: BeautifulSoup) -> list:
-        """통합된 네이버 스마트에디터 콘텐츠 구조 분석 (HTTP/Selenium 공용)"""
+    def _extract_content_structure_unified(self, document, adapter) -> list:
+        """통합된 네이버 스마트에디터 콘텐츠 구조 분석 (HTTP/Selenium 공용, lxml 트리 대상)"""
         try:
             content_structure = []
             
             # 스마트에디터 메인 컨테이너에서 컴포넌트들을 순서대로 찾기
-            main_container = soup.select_one('.se-main-container')
-            if not main_container:
+            main_container = adapter.find(document, '.se-main-container')
+            if main_container is None:
                 # fallback: 전체 문서에서 se-component 찾기
-                components = soup.select('.se-component')
+                components = adapter.find_all(document, '.se-component')
             else:
-                components = main_container.select('.se-component')
+                components = adapter.find_all(main_container, '.se-component')
             
             logger.debug(f"발견된 se-component 개수: {len(components)}")
             
-            for i, component in enumerate(components):
-                component_info = self._analyze_se_component_unified(component, i + 1)
+            # 컴포넌트별 분석은 수 ms 이하라 프로세스 풀 분산(직렬화+재파싱+프로세스 기동)보다 직렬 처리가 빠름
+            # 병렬화는 URL 단위(analyze_selected_urls_with_filtering의 HTTP 선요청)에서 수행
+            analyze_component = self._analyze_se_component_unified
+            for order, component in enumerate(components, 1):
+                component_info = analyze_component(component, order, adapter)
                 if component_info:
                     content_structure.append(component_info)
             
@@ -1777,73 +2117,28 @@ class NaverBlogAdapter:
             logger.debug(f"통합 콘텐츠 구조 분석 실패: {e}")
             return []
     
-    def _analyze_se_component_unified(self, component, order: int) -> dict:
+    def _analyze_se_component_unified(self, component, order: int, adapter) -> dict:
         """통합된 개별 se-component 분석 (HTTP/Selenium 공용)"""
         try:
-            # BeautifulSoup과 WebElement 둘 다 지원
-            if hasattr(component, 'get'):  # BeautifulSoup
-                classes = component.get('class', [])
-                html_str = str(component)
-            else:  # WebElement
-                classes = component.get_attribute('class').split() if component.get_attribute('class') else []
-                html_str = component.get_attribute('outerHTML')
+            # 클래스 목록은 컴포넌트당 한 번만 읽고 분석기들과 공유 (멤버십 검사용 frozenset)
+            classes = frozenset(adapter.classes(component))
             
             component_info = {
                 'order': order,
                 'type': 'unknown',
                 'subtype': '',
                 'content': '',
-                'attributes': {},
-                'raw_html': html_str[:200] + '...' if len(html_str) > 200 else html_str
+                'raw_html': adapter.html_preview(component, 200)
             }
             
-            # 1. 텍스트 컴포넌트 (단락/헤딩)
-            if 'se-text' in classes:
-                component_info.update(self._analyze_text_component_unified(component))
-            
-            # 2. 이미지 컴포넌트 (단일)
-            elif 'se-image' in classes:
-                component_info.update(self._analyze_image_component_unified(component))
-            
-            # 3. 갤러리 컴포넌트 (다중 이미지)
-            elif 'se-imageGroup' in classes or 'se-image-group' in classes:
-                component_info.update(self._analyze_gallery_component_unified(component))
-            
-            # 4. 비디오 컴포넌트
-            elif 'se-video' in classes:
-                component_info.update(self._analyze_video_component_unified(component))
-            
-            # 5. 인용문 컴포넌트
-            elif 'se-quotation' in classes:
-                component_info.update(self._analyze_quotation_component_unified(component))
-            
-            # 6. 표 컴포넌트
-            elif 'se-table' in classes:
-                component_info.update(self._analyze_table_component_unified(component))
-            
-            # 7. 구분선 컴포넌트
-            elif 'se-horizontalLine' in classes or 'se-horizontal-line' in classes:
-                component_info.update(self._analyze_horizontal_line_component_unified(component))
-            
-            # 8. 스티커 컴포넌트
-            elif 'se-sticker' in classes:
-                component_info.update(self._analyze_sticker_component_unified(component))
-            
-            # 9. 외부 임베드 컴포넌트 (OEmbed)
-            elif 'se-oembed' in classes:
-                component_info.update(self._analyze_oembed_component_unified(component))
-            
-            # 10. 외부 링크 프리뷰 컴포넌트 (OG Link)
-            elif 'se-oglink' in classes:
-                component_info.update(self._analyze_oglink_component_unified(component))
-            
-            # 11. 이미지 스트립/슬라이더 컴포넌트
-            elif 'se-imageStrip' in classes:
-                component_info.update(self._analyze_image_strip_component_unified(component))
-            
-            # 12. 기타/알 수 없는 컴포넌트
+            # 클래스 -> 분석기 사전 조회 (여러 se-* 클래스가 겹치면 우선순위가 높은 분석기 사용)
+            matched = [self._component_analyzers[cls] for cls in classes if cls in self._component_analyzers]
+            if matched:
+                _, analyzer = min(matched, key=lambda route: route[0])
             else:
-                component_info.update(self._analyze_unknown_component_unified(component))
+                # 기타/알 수 없는 컴포넌트
+                analyzer = self._analyze_unknown_component_unified
+            component_info.update(analyzer(component, adapter, classes))
             
             return component_info
             
@@ -1851,70 +2146,35 @@ class NaverBlogAdapter:
             logger.debug(f"통합 se-component 분석 실패: {e}")
             return None
     
-    def _get_element_text(self, element):
-        """BeautifulSoup/WebElement 텍스트 추출 통합"""
-        if hasattr(element, 'get_text'):  # BeautifulSoup
-            return element.get_text(strip=True)
-        else:  # WebElement
-            return element.text.strip()
-    
-    def _find_element(self, parent, selector):
-        """BeautifulSoup/WebElement 요소 찾기 통합"""
-        if hasattr(parent, 'select_one'):  # BeautifulSoup
-            return parent.select_one(selector)
-        else:  # WebElement
-            try:
-                return parent.find_element(By.CSS_SELECTOR, selector)
-            except:
-                return None
-    
-    def _find_elements(self, parent, selector):
-        """BeautifulSoup/WebElement 여러 요소 찾기 통합"""
-        if hasattr(parent, 'select'):  # BeautifulSoup
-            return parent.select(selector)
-        else:  # WebElement
-            try:
-                return parent.find_elements(By.CSS_SELECTOR, selector)
-            except:
-                return []
-    
-    def _get_attribute(self, element, attr):
-        """BeautifulSoup/WebElement 속성 추출 통합"""
-        if hasattr(element, 'get'):  # BeautifulSoup
-            return element.get(attr, '')
-        else:  # WebElement
-            return element.get_attribute(attr) or ''
-    
-    def _analyze_text_component_unified(self, component) -> dict:
+    def _analyze_text_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 텍스트 컴포넌트 분석"""
         try:
             result = {
                 'type': 'text',
                 'subtype': 'paragraph',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
             # 텍스트 콘텐츠 추출
-            content_elements = self._find_elements(component, '.se-fs, .se-text-paragraph, p, h1, h2, h3, h4, h5, h6')
+            content_elements = adapter.find_all(component, '.se-fs, .se-text-paragraph, p, h1, h2, h3, h4, h5, h6')
             text_parts = []
             
             heading_detected = False
             
             for elem in content_elements:
-                text = self._get_element_text(elem)
+                text = adapter.text(elem)
                 if text:
                     text_parts.append(text)
                     
                     # 헤딩 타입 확인
-                    tag_name = elem.tag_name if hasattr(elem, 'tag_name') else elem.name
+                    tag_name = adapter.tag(elem)
                     if tag_name and tag_name.lower() in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
                         result['subtype'] = 'heading'
-                        result['attributes']['heading_level'] = int(tag_name[1])
+                        result['heading_level'] = int(tag_name[1])
                         heading_detected = True
                     
                     # 클래스 기반 헤딩 확인
-                    classes = self._get_attribute(elem, 'class').split() if self._get_attribute(elem, 'class') else []
+                    classes = adapter.classes(elem)
                     if any('se-fs' in cls for cls in classes):
                         # 폰트 크기 기반으로 헤딩 추정
                         if any('se-fs-' in cls for cls in classes):
@@ -1925,271 +2185,239 @@ class NaverBlogAdapter:
             
             # 전체 텍스트에서도 헤딩 패턴 확인
             if not heading_detected:
-                full_text = self._get_element_text(component)
+                full_text = adapter.text(component)
                 if full_text:
                     result['content'] = full_text
                     # 짧고 굵은 텍스트는 제목일 가능성
                     if len(full_text) < 50 and '\n' not in full_text:
                         result['subtype'] = 'heading'
             
-            result['attributes']['char_count'] = len(result['content'])
+            result['char_count'] = len(result['content'])
             return result
             
         except Exception as e:
             logger.debug(f"통합 텍스트 컴포넌트 분석 실패: {e}")
-            return {'type': 'text', 'content': '', 'attributes': {}}
+            return {'type': 'text', 'content': ''}
     
-    def _analyze_image_component_unified(self, component) -> dict:
+    def _analyze_image_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 이미지 컴포넌트 분석"""
         try:
             result = {
                 'type': 'image',
                 'subtype': 'single',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
             # 이미지 요소 찾기
-            img = self._find_element(component, 'img')
-            if img:
-                src = self._get_attribute(img, 'src')
-                alt = self._get_attribute(img, 'alt')
+            img = adapter.find(component, 'img')
+            if img is not None:
+                src = adapter.attr(img, 'src')
+                alt = adapter.attr(img, 'alt')
                 
                 result['content'] = alt or '이미지'
-                result['attributes'] = {
-                    'src': src,
-                    'alt': alt,
-                    'width': self._get_attribute(img, 'width'),
-                    'height': self._get_attribute(img, 'height')
-                }
+                result['src'] = src
+                result['alt'] = alt
+                result['width'] = adapter.attr(img, 'width')
+                result['height'] = adapter.attr(img, 'height')
             
             return result
             
         except Exception as e:
             logger.debug(f"통합 이미지 컴포넌트 분석 실패: {e}")
-            return {'type': 'image', 'content': '이미지', 'attributes': {}}
+            return {'type': 'image', 'content': '이미지'}
     
-    def _analyze_gallery_component_unified(self, component) -> dict:
+    def _analyze_gallery_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 갤러리 컴포넌트 분석"""
         try:
             result = {
                 'type': 'gallery',
                 'subtype': 'multiple',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
-            images = self._find_elements(component, 'img')
+            images = adapter.find_all(component, 'img')
+            image_urls = tuple(src for src in (adapter.attr(img, 'src') for img in images) if src)
             result['content'] = f'{len(images)}개 이미지 갤러리'
-            result['attributes'] = {
-                'image_count': len(images),
-                'image_urls': [self._get_attribute(img, 'src') for img in images if self._get_attribute(img, 'src')]
-            }
+            result['image_count'] = len(images)
+            result['image_urls'] = image_urls
             
             return result
             
         except Exception as e:
             logger.debug(f"통합 갤러리 컴포넌트 분석 실패: {e}")
-            return {'type': 'gallery', 'content': '이미지 갤러리', 'attributes': {}}
+            return {'type': 'gallery', 'content': '이미지 갤러리'}
     
-    def _analyze_video_component_unified(self, component) -> dict:
+    def _analyze_video_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 비디오 컴포넌트 분석"""
         try:
             result = {
                 'type': 'video',
                 'subtype': 'embedded',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
             # iframe 기반 비디오 확인
-            iframe = self._find_element(component, 'iframe')
-            if iframe:
-                src = self._get_attribute(iframe, 'src')
+            iframe = adapter.find(component, 'iframe')
+            if iframe is not None:
+                src = adapter.attr(iframe, 'src')
                 result['content'] = '동영상'
-                result['attributes'] = {
-                    'src': src,
-                    'width': self._get_attribute(iframe, 'width'),
-                    'height': self._get_attribute(iframe, 'height')
-                }
+                result['src'] = src
+                result['width'] = adapter.attr(iframe, 'width')
+                result['height'] = adapter.attr(iframe, 'height')
                 
                 # 플랫폼 구분
                 if 'youtube.com' in src or 'youtu.be' in src:
-                    result['attributes']['platform'] = 'youtube'
+                    result['platform'] = 'youtube'
                 elif 'vimeo.com' in src:
-                    result['attributes']['platform'] = 'vimeo'
+                    result['platform'] = 'vimeo'
                 elif 'naver.com' in src:
-                    result['attributes']['platform'] = 'naver'
+                    result['platform'] = 'naver'
+                
+                # iframe으로 확정되면 video 태그 탐색 생략
+                return result
             
             # video 태그 확인
-            video = self._find_element(component, 'video')
-            if video:
-                src = self._get_attribute(video, 'src')
+            video = adapter.find(component, 'video')
+            if video is not None:
+                src = adapter.attr(video, 'src')
                 result['content'] = '동영상'
-                result['attributes'] = {
-                    'src': src,
-                    'width': self._get_attribute(video, 'width'),
-                    'height': self._get_attribute(video, 'height'),
-                    'platform': 'direct'
-                }
+                result['src'] = src
+                result['width'] = adapter.attr(video, 'width')
+                result['height'] = adapter.attr(video, 'height')
+                result['platform'] = 'direct'
             
             return result
             
         except Exception as e:
             logger.debug(f"통합 비디오 컴포넌트 분석 실패: {e}")
-            return {'type': 'video', 'content': '동영상', 'attributes': {}}
+            return {'type': 'video', 'content': '동영상'}
     
-    def _analyze_quotation_component_unified(self, component) -> dict:
-        """통합된 인용문 컴포넌트 분석"""
-        try:
-            result = {
-                'type': 'quotation',
-                'subtype': 'quote',
-                'content': '',
-                'attributes': {}
-            }
-            
-            content = self._get_element_text(component)
-            result['content'] = content
-            result['attributes']['char_count'] = len(content)
-            
-            return result
-            
-        except Exception as e:
-            logger.debug(f"통합 인용문 컴포넌트 분석 실패: {e}")
-            return {'type': 'quotation', 'content': '', 'attributes': {}}
+    def _analyze_quotation_component_unified(self, component, adapter, classes: frozenset) -> dict:
+        """통합된 인용문 컴포넌트 분석 (예외는 상위 디스패처에서 처리)"""
+        # 긴 인용문도 500자 미리보기 + 전체 글자수만 계산
+        content, char_count = adapter.text_bounded(component, 500)
+        return {
+            'type': 'quotation',
+            'subtype': 'quote',
+            'content': content,
+            'char_count': char_count
+        }
     
-    def _analyze_table_component_unified(self, component) -> dict:
+    def _analyze_table_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 표 컴포넌트 분석"""
         try:
             result = {
                 'type': 'table',
                 'subtype': 'data',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
-            # 표 정보 수집
-            rows = self._find_elements(component, 'tr')
-            cols = self._find_elements(component, 'th, td')
+            # 표 정보 수집 (열 개수는 첫 행의 셀로 계산 - 하위 트리 재탐색 없음)
+            rows = adapter.find_all(component, 'tr')
             
             result['content'] = f'{len(rows)}행 표'
-            result['attributes'] = {
-                'row_count': len(rows),
-                'col_count': len(cols) // len(rows) if rows else 0
-            }
+            result['row_count'] = len(rows)
+            result['col_count'] = len(adapter.find_all(rows[0], ':scope > th, :scope > td')) if rows else 0
             
             return result
             
         except Exception as e:
             logger.debug(f"통합 표 컴포넌트 분석 실패: {e}")
-            return {'type': 'table', 'content': '표', 'attributes': {}}
+            return {'type': 'table', 'content': '표'}
     
-    def _analyze_horizontal_line_component_unified(self, component) -> dict:
+    def _analyze_horizontal_line_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 구분선 컴포넌트 분석"""
         return {
             'type': 'horizontal_line',
             'subtype': 'divider',
-            'content': '구분선',
-            'attributes': {}
+            'content': '구분선'
         }
     
-    def _analyze_sticker_component_unified(self, component) -> dict:
-        """통합된 스티커 컴포넌트 분석"""
-        try:
-            result = {
-                'type': 'sticker',
-                'subtype': 'emoji',
-                'content': '',
-                'attributes': {}
-            }
-            
-            img = self._find_element(component, 'img')
-            if img:
-                alt = self._get_attribute(img, 'alt')
-                src = self._get_attribute(img, 'src')
-                result['content'] = alt or '스티커'
-                result['attributes'] = {'src': src, 'alt': alt}
-            else:
-                result['content'] = '스티커'
-            
-            return result
-            
-        except Exception as e:
-            logger.debug(f"통합 스티커 컴포넌트 분석 실패: {e}")
-            return {'type': 'sticker', 'content': '스티커', 'attributes': {}}
+    def _analyze_sticker_component_unified(self, component, adapter, classes: frozenset) -> dict:
+        """통합된 스티커 컴포넌트 분석 (예외는 상위 디스패처에서 처리)"""
+        result = {
+            'type': 'sticker',
+            'subtype': 'emoji',
+            'content': '스티커'
+        }
+        
+        img = adapter.find(component, 'img')
+        if img is not None:
+            alt = adapter.attr(img, 'alt')
+            result['content'] = alt or '스티커'
+            result['src'] = adapter.attr(img, 'src')
+            result['alt'] = alt
+        
+        return result
     
-    def _analyze_oembed_component_unified(self, component) -> dict:
+    def _analyze_oembed_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 외부 임베드 컴포넌트 분석"""
         try:
             result = {
                 'type': 'oembed',
                 'subtype': 'external',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
             # iframe 찾기
-            iframe = self._find_element(component, 'iframe')
-            if iframe:
-                src = self._get_attribute(iframe, 'src')
+            iframe = adapter.find(component, 'iframe')
+            if iframe is not None:
+                src = adapter.attr(iframe, 'src')
                 result['content'] = '외부 콘텐츠 임베드'
-                result['attributes'] = {'src': src}
+                result['src'] = src
                 
                 # 플랫폼 구분
                 if 'instagram.com' in src:
-                    result['attributes']['platform'] = 'instagram'
+                    result['platform'] = 'instagram'
                 elif 'twitter.com' in src or 'x.com' in src:
-                    result['attributes']['platform'] = 'twitter'
+                    result['platform'] = 'twitter'
                 elif 'facebook.com' in src:
-                    result['attributes']['platform'] = 'facebook'
+                    result['platform'] = 'facebook'
             
             return result
             
         except Exception as e:
             logger.debug(f"통합 외부 임베드 컴포넌트 분석 실패: {e}")
-            return {'type': 'oembed', 'content': '외부 콘텐츠', 'attributes': {}}
+            return {'type': 'oembed', 'content': '외부 콘텐츠'}
     
-    def _analyze_oglink_component_unified(self, component) -> dict:
+    def _analyze_oglink_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 외부 링크 프리뷰 컴포넌트 분석 (OG Link)"""
         try:
             result = {
                 'type': 'oglink',
                 'subtype': 'link_preview',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
             # 링크 정보 추출
-            link_element = self._find_element(component, 'a')
-            if link_element:
-                href = self._get_attribute(link_element, 'href')
-                result['attributes']['href'] = href
+            link_element = adapter.find(component, 'a')
+            if link_element is not None:
+                href = adapter.attr(link_element, 'href')
+                result['href'] = href
                 
                 # 도메인 추출
                 if href:
-                    import re
-                    domain_match = re.search(r'https?://([^/]+)', href)
+                    domain_match = _DOMAIN_RE.match(href)
                     if domain_match:
-                        result['attributes']['domain'] = domain_match.group(1)
+                        result['domain'] = domain_match.group(1)
             
             # 제목과 설명 추출
-            title_element = self._find_element(component, '.se-oglink-title, .se-text-title')
-            if title_element:
-                title = self._get_element_text(title_element)
+            title_element = adapter.find(component, '.se-oglink-title, .se-text-title')
+            if title_element is not None:
+                title = adapter.text(title_element)
                 result['content'] = title
-                result['attributes']['title'] = title
+                result['title'] = title
             
-            desc_element = self._find_element(component, '.se-oglink-summary, .se-text-summary')
-            if desc_element:
-                description = self._get_element_text(desc_element)
-                result['attributes']['description'] = description
+            desc_element = adapter.find(component, '.se-oglink-summary, .se-text-summary')
+            if desc_element is not None:
+                description = adapter.text(desc_element)
+                result['description'] = description
             
             # 이미지 정보
-            img_element = self._find_element(component, 'img')
-            if img_element:
-                src = self._get_attribute(img_element, 'src')
-                result['attributes']['thumbnail'] = src
+            img_element = adapter.find(component, 'img')
+            if img_element is not None:
+                src = adapter.attr(img_element, 'src')
+                result['thumbnail'] = src
             
             if not result['content']:
                 result['content'] = '외부 링크 프리뷰'
@@ -2198,92 +2426,87 @@ class NaverBlogAdapter:
             
         except Exception as e:
             logger.debug(f"통합 외부 링크 프리뷰 컴포넌트 분석 실패: {e}")
-            return {'type': 'oglink', 'content': '외부 링크', 'attributes': {}}
+            return {'type': 'oglink', 'content': '외부 링크'}
     
-    def _analyze_image_strip_component_unified(self, component) -> dict:
+    def _analyze_image_strip_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 이미지 스트립/슬라이더 컴포넌트 분석"""
         try:
             result = {
                 'type': 'image_strip',
                 'subtype': 'slider',
-                'content': '',
-                'attributes': {}
+                'content': ''
             }
             
-            # 이미지들 추출
-            images = self._find_elements(component, 'img')
-            image_urls = []
-            
-            for img in images:
-                src = self._get_attribute(img, 'src')
-                if src:
-                    image_urls.append(src)
+            # 이미지들 추출 (GIF 집계가 image_count와 같은 기준이 되도록 반복되는 src도 그대로 유지)
+            images = adapter.find_all(component, 'img')
+            image_urls = tuple(src for src in (adapter.attr(img, 'src') for img in images) if src)
             
             result['content'] = f'이미지 슬라이더 ({len(images)}개)'
-            result['attributes'] = {
-                'image_count': len(images),
-                'image_urls': image_urls,
-                'strip_type': 'horizontal'
-            }
+            result['image_count'] = len(images)
+            result['image_urls'] = image_urls
+            result['strip_type'] = 'horizontal'
             
             # 슬라이더 유형 감지
-            if 'se-imageStrip2' in self._get_attribute(component, 'class'):
-                result['attributes']['strip_version'] = '2'
+            if 'se-imageStrip2' in classes:
+                result['strip_version'] = '2'
             
             return result
             
         except Exception as e:
             logger.debug(f"통합 이미지 스트립 컴포넌트 분석 실패: {e}")
-            return {'type': 'image_strip', 'content': '이미지 슬라이더', 'attributes': {}}
+            return {'type': 'image_strip', 'content': '이미지 슬라이더'}
     
-    def _analyze_unknown_component_unified(self, component) -> dict:
+    def _analyze_unknown_component_unified(self, component, adapter, classes: frozenset) -> dict:
         """통합된 알 수 없는 컴포넌트 분석"""
+        result = {
+            'type': 'unknown',
+            'subtype': 'other',
+            'content': '기타 콘텐츠'
+        }
+        
+        # 예외 가능성이 있는 요소 접근만 보호 (전체 텍스트를 만들지 않고 100자 + 전체 글자수만 계산)
         try:
-            result = {
-                'type': 'unknown',
-                'subtype': 'other',
-                'content': '',
-                'attributes': {}
-            }
-            
-            content = self._get_element_text(component)
-            if content:
-                result['content'] = content[:100]  # 최대 100자
-                result['attributes']['char_count'] = len(content)
-            else:
-                result['content'] = '기타 콘텐츠'
-            
-            # 디버그용 클래스 정보 추가
-            classes = self._get_attribute(component, 'class')
-            if classes:
-                se_classes = [cls for cls in classes.split() if cls.startswith('se-')]
-                if se_classes:
-                    result['attributes']['se_classes'] = se_classes
-                    logger.debug(f"Unknown 컴포넌트 클래스: {se_classes}")
-            
-            return result
-            
+            content, char_count = adapter.text_bounded(component, 100)
         except Exception as e:
             logger.debug(f"통합 알 수 없는 컴포넌트 분석 실패: {e}")
-            return {'type': 'unknown', 'content': '기타', 'attributes': {}}
+            content, char_count = '', 0
+        
+        if content:
+            result['content'] = content  # 최대 100자
+            result['char_count'] = char_count
+        
+        # 디버그용 클래스 정보 추가
+        se_classes = sorted(cls for cls in classes if cls.startswith('se-'))
+        if se_classes:
+            result['se_classes'] = se_classes
+            logger.debug(f"Unknown 컴포넌트 클래스: {se_classes}")
+        
+        return result
     
     # =================================
     # 기존 HTTP 방식 (통합 함수 사용)
     # =================================
     
-    def _extract_content_structure_http(self, soup: BeautifulSoup) -> list:
-        """HTTP 방식: 통합된 구조 분석 함수 사용"""
-        return self._extract_content_structure_unified(soup)
+    def _extract_content_structure_http(self, root) -> list:
+        """HTTP 방식: 본문 분석에서 파싱한 lxml 트리를 그대로 통합 구조 분석 함수에 전달"""
+        try:
+            return self._extract_content_structure_unified(root, _LXML_ADAPTER)
+            
+        except Exception as e:
+            logger.debug(f"HTTP 콘텐츠 구조 분석 실패: {e}")
+            return []
     
     def _extract_content_structure_selenium(self) -> list:
-        """Selenium 방식: WebElement를 BeautifulSoup으로 변환 후 통합 분석 함수 사용"""
+        """Selenium 방식: 본문 컨테이너 HTML만 가져와 lxml로 파싱 후 통합 분석 함수 사용"""
         try:
-            # Selenium에서 HTML 가져와서 BeautifulSoup으로 변환
-            html = self.helper.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            # 전체 page_source 직렬화 대신 스마트에디터 본문 영역 HTML만 한 번의 호출로 가져오기
+            html = self.helper.driver.execute_script(_CONTENT_HTML_JS)
+            if not html:
+                return []
+            root = lxml_html.fragment_fromstring(html, create_parent='div', parser=_html_parser())
             
             # 통합 분석 함수 사용
-            return self._extract_content_structure_unified(soup)
+            return self._extract_content_structure_unified(root, _LXML_ADAPTER)
             
         except Exception as e:
             logger.debug(f"Selenium 콘텐츠 구조 분석 실패: {e}")
@@ -2309,16 +2532,8 @@ class NaverBlogAdapter:
         try:
             logger.info("⬇️ 빠른 스크롤 시작")
             
-            # 한번에 스크롤 후 짧게 대기
-            self.helper.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.3)  # 대기시간 단축: 0.8s → 0.3s
-            
-            # 높이가 변할 수 있는 경우만 한 번 더 시도
-            last_height = self.helper.driver.execute_script("return document.body.scrollHeight")
-            self.helper.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.2)  # 추가 대기시간 최소화
-            
-            final_height = self.helper.driver.execute_script("return document.body.scrollHeight")
+            # 스크롤 2회 + 렌더링 동기화 대기 + 최종 높이 반환을 한 번의 호출로 처리
+            final_height = self.helper.driver.execute_async_script(_SMOOTH_SCROLL_JS)
             logger.info(f"✅ 빠른 스크롤 완료 - 높이: {final_height}px")
             
         except Exception as e:
@@ -2370,83 +2585,95 @@ class NaverBlogAdapter:
     
 
     def analyze_selected_urls_with_filtering(self, selected_urls: list, max_results: int = 3) -> list:
-        """선별된 URL들을 순차 분석하면서 모든 필터링 적용"""
+        """선별된 URL들을 순서대로 분석하면서 모든 필터링 적용 (HTTP 요청은 병렬로 미리 진행)"""
         try:
-            logger.info(f"📝 선별된 {len(selected_urls)}개 URL 순차 분석 시작 (필터링 포함)")
+            logger.info(f"📝 선별된 {len(selected_urls)}개 URL 분석 시작 (필터링 포함)")
             analyzed_blogs = []
+            if not selected_urls:
+                return analyzed_blogs
 
-            for i, url in enumerate(selected_urls):
-                if len(analyzed_blogs) >= max_results:
-                    logger.info(f"🎯 목표 개수 {max_results}개 달성, 분석 중단")
-                    break
+            # HTTP 분석은 네트워크 대기가 대부분이므로 전체 URL을 미리 병렬 요청
+            # (결과는 선별 순서대로 소비해 순위 유지, Selenium 백업은 단일 드라이버라 순차 처리)
+            executor = ThreadPoolExecutor(max_workers=min(8, len(selected_urls)))
+            http_futures = [executor.submit(self.analyze_blog_content_http, url) for url in selected_urls]
 
-                try:
-                    logger.info(f"📝 {i+1}/{len(selected_urls)} - URL 분석 중: {url}")
+            try:
+                for i, (url, http_future) in enumerate(zip(selected_urls, http_futures)):
+                    if len(analyzed_blogs) >= max_results:
+                        logger.info(f"🎯 목표 개수 {max_results}개 달성, 분석 중단")
+                        break
 
-                    # HTTP 방식으로 먼저 시도
-                    analysis_result = None
                     try:
-                        analysis_result = self.analyze_blog_content_http(url)
-                        if analysis_result and analysis_result.get('title') != '분석 실패' and analysis_result.get('content_length', 0) > 0:
-                            logger.info(f"✅ HTTP 방식 분석 성공")
-                        else:
-                            analysis_result = None
-                    except Exception:
-                        analysis_result = None
+                        logger.info(f"📝 {i+1}/{len(selected_urls)} - URL 분석 중: {url}")
 
-                    # HTTP 실패 시 Selenium으로 백업
-                    if not analysis_result:
+                        # HTTP 방식 결과 먼저 확인
+                        analysis_result = None
                         try:
-                            analysis_result = self.analyze_blog_content(url)
-                            logger.info(f"✅ Selenium 방식 분석 성공")
-                        except Exception as selenium_error:
-                            logger.error(f"❌ 분석 실패: {selenium_error}")
+                            analysis_result = http_future.result()
+                            if analysis_result and analysis_result.get('title') != '분석 실패' and analysis_result.get('content_length', 0) > 0:
+                                logger.info(f"✅ HTTP 방식 분석 성공")
+                            else:
+                                analysis_result = None
+                        except Exception:
+                            analysis_result = None
+
+                        # HTTP 실패 시 Selenium으로 백업
+                        if not analysis_result:
+                            try:
+                                analysis_result = self.analyze_blog_content(url)
+                                logger.info(f"✅ Selenium 방식 분석 성공")
+                            except Exception as selenium_error:
+                                logger.error(f"❌ 분석 실패: {selenium_error}")
+                                continue
+
+                        if not analysis_result:
                             continue
 
-                    if not analysis_result:
-                        continue
+                        # 결과 정리
+                        integrated_result = {
+                            'rank': len(analyzed_blogs) + 1,
+                            'title': analysis_result.get('title', '제목 없음'),
+                            'url': url,
+                            'content_length': analysis_result.get('content_length', 0),
+                            'image_count': analysis_result.get('image_count', 0),
+                            'gif_count': analysis_result.get('gif_count', 0),
+                            'video_count': analysis_result.get('video_count', 0),
+                            'tags': analysis_result.get('tags', []),
+                            'text_content': analysis_result.get('text_content', ''),
+                            'content_structure': analysis_result.get('content_structure', [])
+                        }
 
-                    # 결과 정리
-                    integrated_result = {
-                        'rank': len(analyzed_blogs) + 1,
-                        'title': analysis_result.get('title', '제목 없음'),
-                        'url': url,
-                        'content_length': analysis_result.get('content_length', 0),
-                        'image_count': analysis_result.get('image_count', 0),
-                        'gif_count': analysis_result.get('gif_count', 0),
-                        'video_count': analysis_result.get('video_count', 0),
-                        'tags': analysis_result.get('tags', []),
-                        'text_content': analysis_result.get('text_content', ''),
-                        'content_structure': analysis_result.get('content_structure', [])
-                    }
+                        # 모든 필터링 적용
+                        text_content = integrated_result.get('text_content', '')
+                        title = integrated_result.get('title', '')
 
-                    # 모든 필터링 적용
-                    text_content = integrated_result.get('text_content', '')
-                    title = integrated_result.get('title', '')
+                        # 1. 광고/협찬 글 필터링
+                        if is_advertisement_content(text_content, title):
+                            logger.warning(f"🚫 {i+1}번째 URL 제외: 광고/협찬/체험단 글로 판단됨")
+                            continue
 
-                    # 1. 광고/협찬 글 필터링
-                    if is_advertisement_content(text_content, title):
-                        logger.warning(f"🚫 {i+1}번째 URL 제외: 광고/협찬/체험단 글로 판단됨")
-                        continue
+                        # 2. 본문 길이 필터링 (1000자 미만 제외)
+                        content_length = integrated_result.get('content_length', 0)
+                        if content_length < 1000:
+                            logger.warning(f"🚫 {i+1}번째 URL 제외: 본문이 너무 짧음 ({content_length}자 < 1000자)")
+                            continue
 
-                    # 2. 본문 길이 필터링 (1000자 미만 제외)
-                    content_length = integrated_result.get('content_length', 0)
-                    if content_length < 1000:
-                        logger.warning(f"🚫 {i+1}번째 URL 제외: 본문이 너무 짧음 ({content_length}자 < 1000자)")
-                        continue
+                        # 3. 콘텐츠 품질 필터링 (숫자만 나열, 특수문자 과다)
+                        if is_low_quality_content(text_content):
+                            logger.warning(f"🚫 {i+1}번째 URL 제외: 저품질 콘텐츠로 판단됨")
+                            continue
 
-                    # 3. 콘텐츠 품질 필터링 (숫자만 나열, 특수문자 과다)
-                    if is_low_quality_content(text_content):
-                        logger.warning(f"🚫 {i+1}번째 URL 제외: 저품질 콘텐츠로 판단됨")
-                        continue
+                        # 모든 필터를 통과한 양질의 글만 추가
+                        analyzed_blogs.append(integrated_result)
+                        logger.info(f"✅ {i+1}번째 URL 분석 완료 (고품질 정보성 글)")
 
-                    # 모든 필터를 통과한 양질의 글만 추가
-                    analyzed_blogs.append(integrated_result)
-                    logger.info(f"✅ {i+1}번째 URL 분석 완료 (고품질 정보성 글)")
+                    except Exception as e:
+                        logger.error(f"❌ {i+1}번째 URL 분석 실패: {e}")
+                        continue
 
-                except Exception as e:
-                    logger.error(f"❌ {i+1}번째 URL 분석 실패: {e}")
-                    continue
+            finally:
+                # 목표 달성 후 남은 HTTP 요청은 취소 (진행 중인 요청은 기다리지 않음)
+                executor.shutdown(wait=False, cancel_futures=True)
 
             logger.info(f"🎯 선별된 URL 분석 완료: {len(analyzed_blogs)}개 (모든 필터링 적용)")
             return analyzed_blogs
@@ -2462,9 +2689,15 @@ class NaverBlogAdapter:
 
             wait = WebDriverWait(self.helper.driver, 10)
 
-            # 페이지 완전 로딩 대기
+            # 페이지 로딩 대기 (등록 폼 요소가 나타나는 즉시 진행)
             logger.info("새로운 기기 등록 페이지 로딩 대기 중...")
-            time.sleep(5)  # 더 긴 안정화 대기
+            try:
+                wait.until(EC.any_of(
+                    EC.presence_of_element_located((By.ID, "regyn")),
+                    EC.presence_of_element_located((By.ID, "new.save"))
+                ))
+            except TimeoutException:
+                logger.warning("기기 등록 폼 로딩 대기 타임아웃 - 계속 진행")
 
             # '등록' 버튼 찾기 (실제 HTML 구조에 맞춘 셀렉터들)
             register_button_selectors = [
@@ -2590,7 +2823,14 @@ class NaverBlogAdapter:
             logger.info(f"글쓰기 페이지로 이동: {write_url}")
 
             self.helper.goto(write_url)
-            time.sleep(2)  # 페이지 로딩 대기
+
+            # 페이지 로딩 대기 (로딩 완료 즉시 진행)
+            try:
+                WebDriverWait(self.helper.driver, 10).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
+            except TimeoutException:
+                logger.warning("글쓰기 페이지 로딩 대기 타임아웃 - 계속 진행")
 
             # 페이지 이동 확인
             current_url = self.helper.current_url
@@ -2625,18 +2865,10 @@ class NaverBlogAdapter:
             for selector in cancel_selectors:
                 try:
                     if selector.startswith("button:contains"):
-                        # jQuery 스타일 텍스트 선택자를 JavaScript로 변환
-                        elements = self.helper.driver.execute_script("""
-                            var buttons = document.querySelectorAll('button');
-                            for (var i = 0; i < buttons.length; i++) {
-                                if (buttons[i].textContent.includes('취소')) {
-                                    return buttons[i];
-                                }
-                            }
-                            return null;
-                        """)
+                        # jQuery 스타일 텍스트 선택자를 브라우저 네이티브 XPath로 변환
+                        elements = self._find_elements_now(By.XPATH, _DRAFT_CANCEL_BUTTON_XPATH)
                         if elements:
-                            elements.click()
+                            elements[0].click()
                             logger.info("✅ '취소' 버튼 클릭 성공 (텍스트 기반)")
                             time.sleep(1)
                             return True
@@ -2662,61 +2894,51 @@ class NaverBlogAdapter:
         try:
             logger.info("에디터 iframe 감지 및 전환 시작...")
 
-            # iframe이 로드될 때까지 대기
-            time.sleep(2)
-
-            # iframe 감지를 위한 셀렉터들
-            iframe_selectors = [
-                "iframe[src*='blog.naver.com']",  # 네이버 블로그 에디터 iframe
-                "iframe[name*='editor']",  # 에디터 이름 포함
-                "iframe[id*='editor']",  # 에디터 ID 포함
-                "iframe[src*='PostWriteForm']",  # 글쓰기 폼 포함
-                "iframe",  # 모든 iframe (마지막 대안)
-            ]
-
-            for selector in iframe_selectors:
-                try:
-                    iframes = self.helper.find_elements(selector)
-                    if iframes:
-                        logger.info(f"iframe 발견: {selector} (개수: {len(iframes)})")
-
-                        for i, iframe in enumerate(iframes):
-                            try:
-                                # iframe 속성 로깅
-                                src = iframe.get_attribute('src') or ''
-                                name = iframe.get_attribute('name') or ''
-                                id_attr = iframe.get_attribute('id') or ''
+            # iframe이 로드될 때까지 대기 (나타나는 즉시 진행)
+            try:
+                WebDriverWait(self.helper.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "iframe"))
+                )
+            except TimeoutException:
+                logger.warning("iframe 로딩 대기 타임아웃 - 계속 진행")
 
-                                logger.info(f"iframe[{i}] - src: {src[:100]}..., name: {name}, id: {id_attr}")
+            # 에디터 후보 iframe 분류를 브라우저에서 한 번에 수행 (iframe당 속성 조회 왕복 제거)
+            try:
+                candidates = self.helper.driver.execute_script(
+                    _EDITOR_IFRAME_SCAN_JS, _EDITOR_IFRAME_RE.pattern) or []
+            except Exception as e:
+                logger.warning(f"iframe 스캔 실패: {e}")
+                candidates = []
 
-                                # 블로그 에디터와 관련된 iframe인지 확인
-                                if any(keyword in (src + name + id_attr).lower() for keyword in
-                                      ['blog.naver.com', 'editor', 'postwriteform', 'write']):
+            if candidates:
+                logger.info(f"에디터 후보 iframe 발견 (개수: {len(candidates)})")
 
-                                    # iframe으로 전환 시도
-                                    self.helper.driver.switch_to.frame(iframe)
-                                    logger.info(f"✅ iframe으로 전환 성공: {selector}[{i}]")
+            for candidate in candidates:
+                i = candidate.get('index')
+                try:
+                    logger.info(f"iframe[{i}] - src: {(candidate.get('src') or '')[:100]}..., "
+                                f"name: {candidate.get('name')}, id: {candidate.get('id')}")
 
-                                    # iframe 내부 확인 (body 태그 존재 여부)
-                                    try:
-                                        body = self.helper.driver.find_element(By.TAG_NAME, "body")
-                                        if body:
-                                            logger.info("iframe 내부 body 요소 확인됨")
-                                            return True
-                                    except:
-                                        logger.warning("iframe 내부 body 요소를 찾을 수 없음")
+                    # iframe으로 전환 시도
+                    self.helper.driver.switch_to.frame(candidate['element'])
+                    logger.info(f"✅ iframe으로 전환 성공: iframe[{i}]")
 
-                                    # 다시 기본 프레임으로 돌아가서 다른 iframe 시도
-                                    self.helper.driver.switch_to.default_content()
+                    # iframe 내부 확인 (body 태그 존재 여부)
+                    try:
+                        body = self.helper.driver.find_element(By.TAG_NAME, "body")
+                        if body:
+                            logger.info("iframe 내부 body 요소 확인됨")
+                            return True
+                    except:
+                        logger.warning("iframe 내부 body 요소를 찾을 수 없음")
 
-                            except Exception as e:
-                                logger.warning(f"iframe[{i}] 전환 실패: {e}")
-                                # 실패했을 경우 기본 프레임으로 돌아가기
-                                self.helper.driver.switch_to.default_content()
-                                continue
+                    # 다시 기본 프레임으로 돌아가서 다른 iframe 시도
+                    self.helper.driver.switch_to.default_content()
 
                 except Exception as e:
-                    logger.warning(f"iframe 셀렉터 {selector} 실패: {e}")
+                    logger.warning(f"iframe[{i}] 전환 실패: {e}")
+                    # 실패했을 경우 기본 프레임으로 돌아가기
+                    self.helper.driver.switch_to.default_content()
                     continue
 
             logger.warning("적절한 에디터 iframe을 찾을 수 없음")
@@ -2736,57 +2958,24 @@ class NaverBlogAdapter:
         try:
             logger.info("발행 버튼 클릭 시도...")
 
-            # 발행 버튼을 위한 다양한 셀렉터
-            publish_selectors = [
-                "button:contains('발행')",  # 텍스트 기반
-                ".btn_publish",  # 클래스 기반
-                "#publish",  # ID 기반
-                "[value='발행']",  # value 속성 기반
-                "input[type='submit'][value*='발행']",  # submit 버튼
-                ".publish_btn",  # 발행 버튼 클래스
-                "button[onclick*='publish']",  # onclick 속성 기반
-                ".btn_area button:last-child",  # 버튼 영역의 마지막 버튼 (보통 발행)
-            ]
+            # 셀렉터 탐색 동안 implicit wait 해제 (미발견 셀렉터마다 implicit wait만큼 대기하는 문제 방지)
+            with self._implicit_wait_disabled() as driver:
+                for by, value, visible_only in _PUBLISH_SELECTORS:
+                    try:
+                        # find_elements는 미발견 시 예외 대신 빈 리스트 반환 (예외 처리 왕복 제거)
+                        elements = driver.find_elements(by, value)
+                        if not elements:
+                            continue
 
-            for selector in publish_selectors:
-                try:
-                    if selector.startswith("button:contains"):
-                        # jQuery 스타일 텍스트 선택자를 JavaScript로 변환
-                        element = self.helper.driver.execute_script("""
-                            var buttons = document.querySelectorAll('button, input[type="button"], input[type="submit"]');
-                            for (var i = 0; i < buttons.length; i++) {
-                                var text = buttons[i].textContent || buttons[i].value || '';
-                                if (text.includes('발행') || text.includes('게시') || text.includes('등록')) {
-                                    return buttons[i];
-                                }
-                            }
-                            return null;
-                        """)
-                        if element:
-                            # 스크롤해서 버튼을 화면에 표시
-                            self.helper.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                            time.sleep(0.5)
-
-                            # 클릭 시도
-                            self.helper.driver.execute_script("arguments[0].click();", element)
-                            logger.info("✅ 발행 버튼 클릭 성공 (텍스트 기반)")
-                            time.sleep(2)
+                        # 표시 여부 확인 + 스크롤 + 클릭을 한 번의 스크립트로 처리 (클릭 못 하면 false)
+                        old_url = driver.current_url
+                        if driver.execute_async_script(_SCROLL_CLICK_JS, elements[0], visible_only):
+                            logger.info(f"✅ 발행 버튼 클릭 성공: {value}")
+                            self._wait_for_url_change(old_url)
                             return True
-                    else:
-                        element = self.helper.find_element(selector)
-                        if element and element.is_displayed():
-                            # 스크롤해서 버튼을 화면에 표시
-                            self.helper.scroll_to_element(selector)
-                            time.sleep(0.5)
-
-                            # 클릭 시도
-                            if self.helper.click_element(selector):
-                                logger.info(f"✅ 발행 버튼 클릭 성공: {selector}")
-                                time.sleep(2)
-                                return True
-                except Exception as e:
-                    logger.debug(f"셀렉터 {selector} 실패: {e}")
-                    continue
+                    except Exception as e:
+                        logger.debug(f"셀렉터 {value} 실패: {e}")
+                        continue
 
             logger.warning("발행 버튼을 찾을 수 없음")
             return False
@@ -2836,8 +3025,15 @@ class NaverBlogAdapter:
         try:
             logger.info(f"🔍 AI 선별용 블로그 제목 수집 시작: '{keyword}' (최대 {max_results}개)")
 
-            # 분석 전용 브라우저 시작 (초기화되지 않은 경우)
-            if not hasattr(self.helper, 'driver') or not self.helper.driver:
+            # 검색 결과는 정적 HTML이므로 HTTP 수집을 우선 시도 (브라우저 기동 불필요)
+            blog_titles = self._search_blogs_http(keyword, max_results)
+            if blog_titles:
+                logger.info(f"✅ 블로그 제목 수집 완료 (HTTP): {len(blog_titles)}개")
+                return blog_titles
+            logger.info("HTTP 검색 결과 없음 - Selenium 검색으로 전환")
+
+            # HTTP 실패 시에만 분석 전용 브라우저 지연 시작 (이미 기동된 경우 재사용)
+            if not self._browser_started or not getattr(self.helper, 'driver', None):
                 logger.info("🔧 분석 전용 브라우저 시작")
                 self.start_browser_for_analysis()
 
@@ -2858,14 +3054,10 @@ class NaverBlogAdapter:
     def _search_blogs_for_titles_only(self, keyword: str, max_results: int = 30) -> List[Dict]:
         """제목과 URL만 빠르게 수집하는 경량화된 블로그 검색"""
         try:
-            # URL 인코딩 (기존 검색과 동일)
-            import urllib.parse
-            encoded_keyword = urllib.parse.quote(keyword)
-            search_url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&sm=tab_jum&query={encoded_keyword}"
+            search_url = _blog_search_url(keyword)
             logger.info(f"블로그 검색 페이지로 이동: {search_url}")
             self.helper.driver.get(search_url)
-
-            time.sleep(2)  # 페이지 로딩 대기
+            self._wait_for_search_results()  # 검색 결과가 나타나는 즉시 진행
 
             blogs = []
             collected_urls = set()  # 중복 URL 방지
@@ -2876,62 +3068,27 @@ class NaverBlogAdapter:
                     if page > 1:
                         # 다음 페이지로 이동 (네이버 검색은 start 파라미터 사용)
                         start_num = (page - 1) * 10 + 1
-                        next_page_url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&sm=tab_jum&query={encoded_keyword}&start={start_num}"
+                        next_page_url = _blog_search_url(keyword, start_num)
                         logger.info(f"📄 {page}페이지로 이동")
                         self.helper.driver.get(next_page_url)
-                        time.sleep(2)
+                        self._wait_for_search_results()
 
-                    # 블로그 포스트 요소들 찾기 (기존 검색과 동일한 셀렉터 사용)
-                    post_elements = self.helper.driver.find_elements(By.CSS_SELECTOR, "div.title_area")
+                    # 제목과 링크를 한 번의 스크립트 호출로 수집 (요소별 조회 왕복 제거)
+                    post_items = self.helper.driver.execute_script(_SEARCH_TITLE_LINKS_JS) or []
 
-                    if not post_elements:
+                    if not post_items:
                         logger.warning(f"📄 {page}페이지에서 블로그 요소를 찾을 수 없음")
                         break
 
-                    page_blogs = 0
-                    for element in post_elements:
-                        try:
-                            if len(blogs) >= max_results:
-                                break
-
-                            # 제목과 링크 추출 (기존 검색과 동일한 방식)
-                            try:
-                                title_link = element.find_element(By.CSS_SELECTOR, 'a.title_link')
-                            except:
-                                continue
-
-                            if not title_link:
-                                continue
-
-                            # 제목과 URL 추출
-                            title = title_link.text.strip()
-                            url = title_link.get_attribute("href")
-
-                            # 유효성 검사
-                            if not title or not url or url in collected_urls:
-                                continue
-
-                            # 광고 링크 제외 (기존 검색과 동일)
-                            if 'ader.naver.com' in url:
-                                logger.debug(f"광고 링크 스킵: {url[:50]}...")
-                                continue
-
-                            # 네이버 블로그 URL인지 확인
-                            if "blog.naver.com" not in url:
-                                continue
-
-                            collected_urls.add(url)
-                            blogs.append({
-                                'rank': len(blogs) + 1,
-                                'title': title,
-                                'url': url
-                            })
-
-                            page_blogs += 1
-
-                        except Exception as e:
-                            logger.debug(f"개별 블로그 요소 처리 실패: {e}")
-                            continue
+                    # 남은 개수만큼만 소비 (상한 검사는 islice가 처리)
+                    valid_items = self._iter_valid_search_items(post_items, collected_urls)
+                    page_start = len(blogs)
+                    blogs.extend(
+                        {'rank': rank, 'title': title, 'url': url}
+                        for rank, (title, url) in enumerate(
+                            islice(valid_items, max_results - page_start), page_start + 1)
+                    )
+                    page_blogs = len(blogs) - page_start
 
                     logger.info(f"📄 {page}페이지에서 {page_blogs}개 제목 수집 (총 {len(blogs)}개)")
 
@@ -2949,6 +3106,79 @@ class NaverBlogAdapter:
             logger.error(f"블로그 제목 검색 실패: {e}")
             return []
 
+    def _search_blogs_http(self, keyword: str, max_results: int = 30) -> List[Dict]:
+        """HTTP로 검색 결과 페이지들을 병렬 수집 (페이지별 start 오프셋은 서로 독립)"""
+        try:
+            page_count = max(1, (max_results + 9) // 10)
+            page_urls = [_blog_search_url(keyword, start) for start in _SEARCH_PAGE_STARTS[:page_count]]
+
+            with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+                page_results = list(executor.map(self._fetch_search_page_http, page_urls))
+
+            # 첫 페이지가 비어 있으면 차단/캡차 페이지로 간주
+            if not page_results[0]:
+                return []
+
+            # 페이지 순서대로 병합한 뒤 순위는 필터링 후 한 번에 부여
+            collected_urls = set()  # 중복 URL 방지
+            valid_items = self._iter_valid_search_items(chain.from_iterable(page_results), collected_urls)
+            blogs = [
+                {'rank': rank, 'title': title, 'url': url}
+                for rank, (title, url) in enumerate(islice(valid_items, max_results), 1)
+            ]
+
+            logger.info(f"🎯 HTTP 블로그 제목 수집 완료: {len(blogs)}개 ({len(page_urls)}페이지 병렬)")
+            return blogs
+
+        except Exception as e:
+            logger.warning(f"HTTP 블로그 제목 검색 실패: {e}")
+            return []
+
+    def _fetch_search_page_http(self, search_url: str) -> List[Dict]:
+        """검색 결과 페이지 1개에서 제목/URL 추출 (실패 시 빈 리스트)"""
+        try:
+            response = self._search_http.get(search_url)
+            if response.status_code != 200 or not response.content:
+                return []
+
+            # 제목 링크만 필요하므로 BeautifulSoup 트리 대신 lxml + 사전 컴파일 XPath 사용
+            document = lxml_html.fromstring(response.content)
+
+            # 키워드 강조 태그(<mark>) 사이 공백을 유지하도록 공백만 정규화
+            return [
+                {'title': ' '.join(title_link.text_content().split()), 'url': title_link.get('href') or ''}
+                for title_link in _SEARCH_TITLE_LINK_XPATH(document)
+            ]
+
+        except Exception as e:
+            logger.debug(f"검색 페이지 HTTP 요청 실패: {search_url} - {e}")
+            return []
+
+    def _iter_valid_search_items(self, items, collected_urls: set):
+        """검색 결과 항목 중 유효한 네이버 블로그 (제목, URL)만 순서대로 반환"""
+        for item in items:
+            title = (item.get('title') or '').strip()
+            url = item.get('url') or ''
+
+            # 유효성 검사
+            if not title or not url or url in collected_urls:
+                continue
+
+            # 호스트 단위로 판별 (쿼리스트링 등에 포함된 도메인 문자열에 속지 않도록)
+            host = urlsplit(url).hostname or ''
+
+            # 광고 링크 제외 (기존 검색과 동일)
+            if host in _AD_HOSTS:
+                logger.debug(f"광고 링크 스킵: {url[:50]}...")
+                continue
+
+            # 네이버 블로그 URL인지 확인
+            if host not in _BLOG_HOSTS:
+                continue
+
+            collected_urls.add(url)
+            yield title, url
+
 
 class TistoryAdapter:
     """티스토리 어댑터 (미구현)"""
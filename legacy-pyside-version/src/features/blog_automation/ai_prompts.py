@@ -2,98 +2,113 @@
 블로그 자동화 AI 프롬프트 및 구조화된 데이터 생성 (engine_local)
 CLAUDE.md 구조: 순수 계산만, I/O/로깅/시그널 금지
 """
+import json
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Any
 
 
+def _freeze_guidelines(table: Dict) -> MappingProxyType:
+    """지침 테이블을 읽기 전용으로 고정하고, 목록(튜플) 항목은 ', ' 결합 문자열(<키>_joined)을 미리 생성"""
+    return MappingProxyType({
+        name: MappingProxyType({
+            **fields,
+            **{f"{key}_joined": ', '.join(value) for key, value in fields.items() if isinstance(value, tuple)}
+        })
+        for name, fields in table.items()
+    })
+
+
 class BlogPromptComponents:
     """블로그 프롬프트 공용 컴포넌트 모음"""
 
     # 컨텐츠 유형별 지침 (공용)
-    CONTENT_GUIDELINES = {
+    CONTENT_GUIDELINES = _freeze_guidelines({
         "후기/리뷰형": {
             "approach": "개인 경험과 솔직한 후기를 중심으로 '유일무이한 콘텐츠' 작성",
             "structure": "사용 전 고민 → 직접 사용 경험 → 장단점 솔직 후기 → 최종 평가 및 추천",
-            "keywords": ["직접 써봤어요", "솔직 후기", "개인적으로", "실제로 사용해보니", "추천하는 이유"],
-            "focus_areas": ["개인 경험과 솔직한 후기", "장단점 균형 제시", "구체적 사용 데이터"]
+            "keywords": ("직접 써봤어요", "솔직 후기", "개인적으로", "실제로 사용해보니", "추천하는 이유"),
+            "focus_areas": ("개인 경험과 솔직한 후기", "장단점 균형 제시", "구체적 사용 데이터")
         },
         "정보/가이드형": {
             "approach": "정확하고 풍부한 정보를 체계적으로 제공하여 검색자의 궁금증 완전 해결",
             "structure": "문제 정의 → 해결책 제시 → 단계별 가이드 → 주의사항 → 마무리",
-            "keywords": ["완벽 정리", "총정리", "핵심 포인트", "단계별 가이드", "정확한 정보"],
-            "focus_areas": ["체계적 구조와 소제목", "실용적 가이드 제공", "구체적 실행 방법"]
+            "keywords": ("완벽 정리", "총정리", "핵심 포인트", "단계별 가이드", "정확한 정보"),
+            "focus_areas": ("체계적 구조와 소제목", "실용적 가이드 제공", "구체적 실행 방법")
         },
         "비교/추천형": {
             "approach": "체계적 비교분석으로 독자의 선택 고민을 완전히 해결",
             "structure": "비교 기준 제시 → 각 옵션 분석 → 장단점 비교 → 상황별 추천 → 최종 결론",
-            "keywords": ["VS 비교", "Best 5", "장단점", "상황별 추천", "가성비"],
-            "focus_areas": ["객관적 비교 기준", "상황별 맞춤 추천", "명확한 선택 가이드"]
+            "keywords": ("VS 비교", "Best 5", "장단점", "상황별 추천", "가성비"),
+            "focus_areas": ("객관적 비교 기준", "상황별 맞춤 추천", "명확한 선택 가이드")
         }
-    }
+    })
 
     # 후기 세부 유형별 지침 (공용)
-    REVIEW_DETAIL_GUIDELINES = {
+    REVIEW_DETAIL_GUIDELINES = _freeze_guidelines({
         "내돈내산 후기": {
             "description": "직접 구매해서 써본 솔직한 개인 후기",
-            "key_points": [
+            "key_points": (
                 "본문 제일 첫번째에 '직접 구매해서 사용해본 후기입니다' 또는 '내돈내산 후기입니다' 자연스럽게 명시",
                 "구매하게 된 이유와 고민 표현",
                 "장단점을 균형있게 서술"
-            ],
+            ),
             "transparency": "개인 구매로 편견 없는 솔직한 후기임을 강조"
         },
         "협찬 후기": {
             "description": "브랜드에서 제공받은 제품의 정직한 리뷰",
-            "key_points": [
+            "key_points": (
                 "본문 제일 첫번째에 '브랜드로부터 제품을 제공받아 작성한 후기입니다' 명시",
                 "협찬이지만 솔직한 평가를 하겠다고 표현",
                 "장단점을 균형있게 서술"
-            ],
+            ),
             "transparency": "절대 '구매했다', '샀다' 등의 표현 사용 금지"
         },
         "체험단 후기": {
             "description": "체험단 참여를 통한 제품 사용 후기",
-            "key_points": [
+            "key_points": (
                 "본문 제일 첫번째에 '체험단에 참여하여 작성한 후기입니다' 명시",
                 "체험 기회에 대한 감사 표현",
                 "객관적이고 공정한 평가 의지 표현"
-            ],
+            ),
             "transparency": "절대 '구매했다', '샀다' 등의 표현 사용 금지"
         },
         "대여/렌탈 후기": {
             "description": "렌탈 서비스를 이용한 제품 사용 후기",
-            "key_points": [
+            "key_points": (
                 "본문 제일 첫번째에 '렌탈 서비스로 이용해본 후기입니다' 명시",
                 "렌탈을 선택한 이유 표현",
                 "렌탈 서비스의 장단점 균형있게 서술"
-            ],
+            ),
             "transparency": "렌탈 서비스 특성상 제한적 사용 후기임을 안내"
         }
-    }
+    })
 
     # 말투별 지침 (공용)
-    TONE_GUIDELINES = {
+    TONE_GUIDELINES = _freeze_guidelines({
         "친근한 반말체": {
             "style": "친구와 대화하듯 편안하고 친근한 말투",
-            "examples": ["써봤는데 진짜 좋더라~", "완전 강추!", "솔직히 말하면", "이거 진짜 대박이야"],
+            "examples": ("써봤는데 진짜 좋더라~", "완전 강추!", "솔직히 말하면", "이거 진짜 대박이야"),
             "ending": "댓글로 궁금한 거 물어봐!",
             "sentence_style": "짧고 리드미컬한 문장",
-            "key_features": ["감탄사와 줄임말 활용", "개인적 경험 많이 포함", "유머와 재미 요소"]
+            "key_features": ("감탄사와 줄임말 활용", "개인적 경험 많이 포함", "유머와 재미 요소")
         },
         "친근한 존댓말체": {
             "style": "친근하고 부드러운 존댓말로 따뜻한 느낌",
-            "examples": ["궁금해서 찾아봤어요", "써봤는데 좋더라구요", "이런 게 있더라구요", "도움이 될 것 같아요"],
+            "examples": ("궁금해서 찾아봤어요", "써봤는데 좋더라구요", "이런 게 있더라구요", "도움이 될 것 같아요"),
             "ending": "도움이 되셨으면 좋겠어요~",
             "sentence_style": "부드럽고 따뜻한 존댓말 문장",
-            "key_features": ["부드러운 존댓말", "따뜻하고 친근한 어조", "자연스러운 개인 경험"]
+            "key_features": ("부드러운 존댓말", "따뜻하고 친근한 어조", "자연스러운 개인 경험")
         },
         "정중한 존댓말체": {
             "style": "정중하고 예의 바른 존댓말로 신뢰감 조성",
-            "examples": ["사용해보았습니다", "추천드립니다", "도움이 되시길 바랍니다", "참고하시기 바랍니다"],
+            "examples": ("사용해보았습니다", "추천드립니다", "도움이 되시길 바랍니다", "참고하시기 바랍니다"),
             "ending": "도움이 되셨으면 좋겠습니다.",
             "sentence_style": "완성도 높은 정중한 문장",
-            "key_features": ["전문성과 신뢰감", "체계적 정보 전달", "예의 바른 표현"]
+            "key_features": ("전문성과 신뢰감", "체계적 정보 전달", "예의 바른 표현")
         }
-    }
+    })
 
 
     @classmethod
@@ -133,8 +148,8 @@ class BlogPromptComponents:
             content_guideline = cls.get_content_guideline(content_type)
 
         approach = content_guideline.get("approach", "")
-        keywords = content_guideline.get("keywords", [])
-        focus_areas = content_guideline.get("focus_areas", [])
+        keywords_joined = content_guideline.get("keywords_joined", "")
+        focus_areas_joined = content_guideline.get("focus_areas_joined", "")
 
         # 후기 세부 유형 지침 가져오기 (후기/리뷰형일 때만)
         review_guideline = cls.get_review_detail_guideline(review_detail) if review_detail and content_type == "후기/리뷰형" else {}
@@ -153,8 +168,8 @@ class BlogPromptComponents:
 
 **{content_type} 특징**:
 - 접근법: {approach}
-- 핵심 키워드: {', '.join(keywords)}
-- 중점 영역: {', '.join(focus_areas)}
+- 핵심 키워드: {keywords_joined}
+- 중점 영역: {focus_areas_joined}
 {f'''
 **후기 세부 유형**: {review_detail}
 - 설명: {review_guideline.get("description", "")}
@@ -208,9 +223,10 @@ JSON 형태로 정확히 10개 제목과 각 제목에 맞는 블로그 검색
         # 보조키워드 텍스트 준비
         sub_keywords_text = ""
         sub_keywords_criteria = ""
-        if sub_keywords and sub_keywords.strip():
-            sub_keywords_text = f"**보조 키워드**: {sub_keywords.strip()}"
-            sub_keywords_criteria = f"6. 보조 키워드({sub_keywords.strip()})와 관련성이 있는 제목"
+        stripped_sub_keywords = sub_keywords.strip() if sub_keywords else ""  # 한 번만 정리해서 재사용
+        if stripped_sub_keywords:
+            sub_keywords_text = f"**보조 키워드**: {stripped_sub_keywords}"
+            sub_keywords_criteria = f"6. 보조 키워드({stripped_sub_keywords})와 관련성이 있는 제목"
 
         prompt = f"""네이버 블로그에서 '{search_keyword}' 키워드로 검색한 블로그 제목들 중에서, 아래 조건에 가장 적합한 상위 10개를 선별해주세요.
 
@@ -272,63 +288,71 @@ class BlogContentStructure:
     
     def analyze_blog_structure(self, analyzed_blogs: List[Dict]) -> Dict:
         """분석된 블로그들의 구조를 분석하여 AI용 데이터 생성"""
-        try:
-            structured_data = {
-                "keyword": "",
-                "competitor_analysis": {
-                    "top_blogs": [],
-                    "summary": {
-                        "total_blogs": len(analyzed_blogs),
-                        "avg_content_length": 0,
-                        "common_tags": [],
-                        "content_patterns": []
-                    }
-                }
+        # 루프에서 채울 컨테이너는 지역 변수로 먼저 만들고 결과 dict에서 참조 (중첩 인덱싱 반복 방지)
+        top_blogs = []
+        summary = {
+            "total_blogs": len(analyzed_blogs),
+            "avg_content_length": 0,
+            "common_tags": [],
+            "content_patterns": []
+        }
+        structured_data = {
+            "keyword": "",
+            "competitor_analysis": {
+                "top_blogs": top_blogs,
+                "summary": summary
             }
+        }
+        
+        total_length = 0
+        total_images = 0
+        tag_counter = Counter()  # 태그 목록을 따로 모으지 않고 루프 안에서 바로 집계
+        
+        for blog in analyzed_blogs:
+            # 개별 블로그 구조 분석
+            blog_structure = self.extract_blog_structure(blog)
+            top_blogs.append(blog_structure)
             
-            total_length = 0
-            all_tags = []
-            
-            for blog in analyzed_blogs:
-                # 개별 블로그 구조 분석
-                blog_structure = self.extract_blog_structure(blog)
-                structured_data["competitor_analysis"]["top_blogs"].append(blog_structure)
-                
-                # 통계 계산용
-                total_length += blog.get('content_length', 0)
-                all_tags.extend(blog.get('tags', []))
-            
-            # 평균 및 공통 패턴 계산
-            if analyzed_blogs:
-                structured_data["competitor_analysis"]["summary"]["avg_content_length"] = total_length // len(analyzed_blogs)
-                
-                # 가장 많이 사용된 태그 상위 5개
-                from collections import Counter
-                tag_counter = Counter(all_tags)
-                structured_data["competitor_analysis"]["summary"]["common_tags"] = [
-                    tag for tag, count in tag_counter.most_common(5)
-                ]
-            
-            return structured_data
+            # 통계 계산용 (구조 추출 시 읽은 값 재사용)
+            statistics = blog_structure["statistics"]
+            total_length += statistics["content_length"]
+            total_images += statistics["image_count"]
+            tag_counter.update(blog_structure["tags"])
+        
+        # 평균 및 공통 패턴 계산
+        if analyzed_blogs:
+            summary["avg_content_length"] = total_length // len(analyzed_blogs)
+            summary["avg_image_count"] = total_images // len(analyzed_blogs)
             
-        except Exception as e:
-            # engine_local에서는 로깅 금지 - 기본값 반환
-            return {}
+            # 가장 많이 사용된 태그 상위 5개 (most_common(n)은 내부적으로 heapq.nlargest 사용)
+            summary["common_tags"] = [
+                tag for tag, count in tag_counter.most_common(5)
+            ]
+        
+        return structured_data
     
     def extract_blog_structure(self, blog: Dict) -> Dict:
-        """개별 블로그의 구조 추출"""
+        """개별 블로그의 구조 추출
+
+        blog는 NaverBlogAdapter.analyze_selected_urls_with_filtering이 만드는 분석 결과로
+        title, url, content_length, image_count, gif_count, video_count, tags, text_content 키를
+        모두 포함해야 함 (키가 없으면 KeyError가 호출자까지 전달됨)
+        """
+        # 스키마가 보장되므로 직접 인덱싱 (값이 None으로 들어온 경우만 빈 값으로 처리)
+        tags = blog['tags'] or []
+        text_content = blog['text_content'] or ''
         return {
-            "title": blog.get('title', ''),
-            "url": blog.get('url', ''),
+            "title": blog['title'],
+            "url": blog['url'],
             "statistics": {
-                "content_length": blog.get('content_length', 0),
-                "image_count": blog.get('image_count', 0),
-                "gif_count": blog.get('gif_count', 0),
-                "video_count": blog.get('video_count', 0),
-                "tag_count": len(blog.get('tags', []))
+                "content_length": blog['content_length'],
+                "image_count": blog['image_count'],
+                "gif_count": blog['gif_count'],
+                "video_count": blog['video_count'],
+                "tag_count": len(tags)
             },
-            "tags": blog.get('tags', []),
-            "content_preview": blog.get('text_content', '')[:200] + "..." if blog.get('text_content', '') else ''
+            "tags": tags,
+            "content_preview": f"{text_content[:200]}..." if text_content else ''
         }
 
 
@@ -341,8 +365,6 @@ class BlogSummaryPrompts:
 
         # engine_local에서는 로깅 금지
 
-        import json
-
         # JSON 입력 데이터 구조화
         input_data = {
             "target_info": {
@@ -355,8 +377,9 @@ class BlogSummaryPrompts:
         }
 
         # 보조키워드가 있으면 추가
-        if sub_keywords and sub_keywords.strip():
-            input_data["target_info"]["sub_keywords"] = sub_keywords.strip()
+        stripped_sub_keywords = sub_keywords.strip() if sub_keywords else ""
+        if stripped_sub_keywords:
+            input_data["target_info"]["sub_keywords"] = stripped_sub_keywords
 
         # 경쟁 블로그 데이터 추가
         for i, blog in enumerate(competitor_blogs, 1):
@@ -409,6 +432,21 @@ class BlogSummaryPrompts:
 
 class BlogAIPrompts:
     """2차 가공: 글작성 AI를 위한 프롬프트 템플릿"""
+
+    # 마크다운 구조 / 글쓰기 품질 규칙 (고정 문구)
+    WRITING_RULES = """
+
+## 마크다운 구조 규칙 (자동화 호환성)
+- **대제목**: ## 만 사용 (### 사용 금지)
+- **소제목**: ### 텍스트 (세부 항목용)
+- **강조**: **텍스트** (단계명, 중요 포인트)
+- **리스트**: - 항목 (일반 목록)
+- **체크리스트**: ✓ 항목 (완료/확인 항목)
+- **번호 목록**: 1. 항목 (순서가 중요한 경우)
+
+## 글쓰기 품질 요구사항
+- **자연스러운 문체**: AI 생성티 없는 개성 있고 자연스러운 어투로 작성
+- **완전한 내용**: XX공원, OO병원 같은 placeholder 사용 금지. 구체적인 정보가 없다면 "근처 공원", "동네 병원" 등 일반적 표현 사용"""
     
     @staticmethod
     def generate_content_analysis_prompt(main_keyword: str, sub_keywords: str, structured_data: Dict, content_type: str = "정보/가이드형", tone: str = "정중한 존댓말체", review_detail: str = "", blogger_identity: str = "", summary_result: str = "", selected_title: str = "", search_keyword: str = "") -> str:
@@ -420,6 +458,23 @@ class BlogAIPrompts:
         top_blogs = competitor_info.get("top_blogs", [])
         summary = competitor_info.get("summary", {})
         
+        # 평균 이미지 개수 (analyze_blog_structure에서 미리 계산, 없는 구조 데이터만 직접 계산)
+        avg_image_count = summary.get("avg_image_count")
+        if avg_image_count is None:
+            avg_image_count = sum(blog.get("statistics", {}).get("image_count", 0) for blog in top_blogs) // max(1, len(top_blogs)) if top_blogs else 3
+        
+        # 프롬프트에 실제로 쓰이는 값만으로 캐시 키 구성 (동일 조건 재생성 시 캐시된 문자열 반환)
+        return BlogAIPrompts._build_content_analysis_prompt(
+            main_keyword, sub_keywords, content_type, tone, review_detail, blogger_identity,
+            summary_result, selected_title, search_keyword,
+            len(top_blogs), avg_image_count, tuple(summary.get("common_tags", []))
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)  # 여러 키워드 연속 발행/재시도 시에도 캐시가 밀려나지 않도록 (항목당 수 KB)
+    def _build_content_analysis_prompt(main_keyword: str, sub_keywords: str, content_type: str, tone: str, review_detail: str, blogger_identity: str, summary_result: str, selected_title: str, search_keyword: str, blog_count: int, avg_image_count: int, common_tags: tuple) -> str:
+        """콘텐츠 분석 프롬프트 본문 생성 (해시 가능한 인자만 받아 lru_cache 적용)"""
+
         # 공용 컴포넌트에서 컨텐츠 지침 가져오기
         current_content = BlogPromptComponents.get_content_guideline(content_type)
         if not current_content:
@@ -435,25 +490,19 @@ class BlogAIPrompts:
             # 기본값으로 정중한 존댓말체 사용
             current_tone = BlogPromptComponents.get_tone_guideline("정중한 존댓말체")
         
-        # 평균 태그 개수 계산
-        avg_tag_count = sum(len(blog.get("tags", [])) for blog in top_blogs) // max(1, len(top_blogs)) if top_blogs else 5
-        
-        # 평균 이미지 개수 계산
-        avg_image_count = sum(blog.get("statistics", {}).get("image_count", 0) for blog in top_blogs) // max(1, len(top_blogs)) if top_blogs else 3
-        
-
         # 블로그 소개 처리
         if blogger_identity and blogger_identity.strip():
             role_description = f"당신은 네이버 블로그에서 {blogger_identity.strip()} 블로그를 운영하고 있습니다. 독자들이 진짜 도움이 되고 재미있게 읽을 수 있는 글을 쓰는 것이 목표입니다."
         else:
             role_description = "당신은 네이버 블로그에서 인기 있는 글을 쓰는 블로거입니다. 독자들이 진짜 도움이 되고 재미있게 읽을 수 있는 글을 쓰는 것이 목표입니다."
 
-        prompt = f"""
+        # 프롬프트 조각을 모아 마지막에 한 번만 결합 (+= 반복 시 중간 문자열 재생성 방지)
+        parts = [f"""
 # AI 역할 설정
 {role_description}
 
 ## 참고할 경쟁 블로그 요약 정보
-'{search_keyword}'로 검색시 노출되는 상위 {len(top_blogs)}개 블로그 글을 요약한 결과입니다. 이를 참고하여 더 나은 독창적인 컨텐츠를 작성해주세요:
+'{search_keyword}'로 검색시 노출되는 상위 {blog_count}개 블로그 글을 요약한 결과입니다. 이를 참고하여 더 나은 독창적인 컨텐츠를 작성해주세요:
 
 {summary_result if summary_result.strip() else '참고할 만한 경쟁사 분석 정보가 없으니, 자연스럽고 유용한 컨텐츠로 작성해주세요.'}
 
@@ -467,55 +516,44 @@ class BlogAIPrompts:
 - **작성할 글 제목**: "{selected_title}"
 - **메인 키워드**: "{main_keyword}"
 - **보조 키워드**: "{sub_keywords if sub_keywords.strip() else '메인 키워드와 관련된 보조 키워드들을 3-5개 직접 생성하여 활용'}"
-- **컨텐츠 유형**: {content_type} ({current_content['approach']})"""
+- **컨텐츠 유형**: {content_type} ({current_content['approach']})"""]
 
         # 후기 세부 유형 가이드라인 추가 (후기/리뷰형일 때만) - 기본 정보 바로 다음에 위치
         if current_review_detail:
-            prompt += f"""
+            parts.append(f"""
 
 ## 후기 세부 유형
 - **후기 유형**: {review_detail}
 - **후기 설명**: {current_review_detail['description']}
 - **투명성 원칙**: {current_review_detail['transparency']}
-- **핵심 포인트**: {', '.join(current_review_detail['key_points'])}"""
+- **핵심 포인트**: {current_review_detail['key_points_joined']}""")
 
-        prompt += f"""
+        parts.append(f"""
 
 ## 말투 지침
 - **선택된 말투**: {tone}
 - **말투 스타일**: {current_tone['style']}
-- **예시 표현**: {', '.join(current_tone['examples'])}
+- **예시 표현**: {current_tone['examples_joined']}
 - **문장 특징**: {current_tone['sentence_style']}
-- **주요 특색**: {', '.join(current_tone['key_features'])}
+- **주요 특색**: {current_tone['key_features_joined']}
 - **마무리 문구**: {current_tone['ending']}
 
 ## 글 구성 방식
 - **글 구조**: {current_content['structure']}
-- **주요 초점**: {', '.join(current_content['focus_areas'])}
-- **핵심 표현**: {', '.join(current_content['keywords'])}
+- **주요 초점**: {current_content['focus_areas_joined']}
+- **핵심 표현**: {current_content['keywords_joined']}
 
 ## SEO 및 기술적 요구사항
 - 글자 수: 1,700-2,000자 (공백 제외)
 - 메인 키워드: 5-6회 자연 반복
 - 보조 키워드: 각각 3-4회 사용
 - 이미지: {avg_image_count}개 이상 (이미지) 표시로 배치, 필요시 연속 4개 배치 가능
-- 동영상: 1개 (동영상) 표시로 배치
-
-## 마크다운 구조 규칙 (자동화 호환성)
-- **대제목**: ## 만 사용 (### 사용 금지)
-- **소제목**: ### 텍스트 (세부 항목용)
-- **강조**: **텍스트** (단계명, 중요 포인트)
-- **리스트**: - 항목 (일반 목록)
-- **체크리스트**: ✓ 항목 (완료/확인 항목)
-- **번호 목록**: 1. 항목 (순서가 중요한 경우)
+- 동영상: 1개 (동영상) 표시로 배치""")
 
-## 글쓰기 품질 요구사항
-- **자연스러운 문체**: AI 생성티 없는 개성 있고 자연스러운 어투로 작성
-- **완전한 내용**: XX공원, OO병원 같은 placeholder 사용 금지. 구체적인 정보가 없다면 "근처 공원", "동네 병원" 등 일반적 표현 사용"""
+        # 치환값이 없는 고정 규칙 블록은 클래스 상수 그대로 사용
+        parts.append(BlogAIPrompts.WRITING_RULES)
 
-
-
-        prompt += f"""
+        parts.append(f"""
 
 
 # 출력 형식
@@ -538,38 +576,33 @@ class BlogAIPrompts:
 
 [결론 - 요약 및 독자 행동 유도]
 
-{f"[상위 블로그 인기 태그 참고: {', '.join(['#' + tag.lstrip('#') for tag in summary.get('common_tags', [])])}]" if summary.get("common_tags") else ""}
+{f"[상위 블로그 인기 태그 참고: {', '.join(['#' + tag.lstrip('#') for tag in common_tags])}]" if common_tags else ""}
 [위 참고 태그와 작성한 글 내용을 토대로 적합한 태그 5개 이상을 # 형태로 작성]
 ```
-"""
-        return prompt.strip()
+""")
+        return ''.join(parts).strip()
     
 
 def create_ai_request_data(main_keyword: str, sub_keywords: str, analyzed_blogs: List[Dict], content_type: str = "정보/가이드형", tone: str = "정중한 존댓말체", review_detail: str = "", blogger_identity: str = "", summary_result: str = "", selected_title: str = "", search_keyword: str = "") -> Dict:
     """AI 요청용 데이터 생성 (컨텐츠 유형과 말투, 후기 세부 유형 포함)"""
-    try:
-        structure_analyzer = BlogContentStructure()
-        structured_data = structure_analyzer.analyze_blog_structure(analyzed_blogs)
-        structured_data["keyword"] = main_keyword  # 기존 호환성을 위해 메인 키워드 저장
-
-        # AI 프롬프트 생성 (스타일 옵션 포함)
-        prompt_generator = BlogAIPrompts()
-        ai_prompt = prompt_generator.generate_content_analysis_prompt(main_keyword, sub_keywords, structured_data, content_type, tone, review_detail, blogger_identity, summary_result, selected_title, search_keyword)
-        
-        return {
-            "structured_data": structured_data,
-            "ai_prompt": ai_prompt,
-            "raw_blogs": analyzed_blogs,
-            "main_keyword": main_keyword,
-            "sub_keywords": sub_keywords,
-            "content_type": content_type,
-            "tone": tone,
-            "review_detail": review_detail
-        }
-        
-    except Exception as e:
-        # engine_local에서는 로깅 금지 - 기본값 반환
-        return {}
+    structure_analyzer = BlogContentStructure()
+    structured_data = structure_analyzer.analyze_blog_structure(analyzed_blogs)
+    structured_data["keyword"] = main_keyword  # 기존 호환성을 위해 메인 키워드 저장
+
+    # AI 프롬프트 생성 (스타일 옵션 포함)
+    prompt_generator = BlogAIPrompts()
+    ai_prompt = prompt_generator.generate_content_analysis_prompt(main_keyword, sub_keywords, structured_data, content_type, tone, review_detail, blogger_identity, summary_result, selected_title, search_keyword)
+    
+    return {
+        "structured_data": structured_data,
+        "ai_prompt": ai_prompt,
+        "raw_blogs": analyzed_blogs,
+        "main_keyword": main_keyword,
+        "sub_keywords": sub_keywords,
+        "content_type": content_type,
+        "tone": tone,
+        "review_detail": review_detail
+    }
 
 
 def combine_blog_contents(analyzed_blogs: list) -> str:
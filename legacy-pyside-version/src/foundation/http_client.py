@@ -209,7 +209,8 @@ class HTTPClient:
     def __init__(self, 
                  timeout: float = 60.0,
                  max_retries: int = 3,
-                 backoff_factor: float = 10.0):
+                 backoff_factor: float = 10.0,
+                 pool_maxsize: int = 16):
         """
         HTTP 클라이언트 초기화
         
@@ -217,6 +218,7 @@ class HTTPClient:
             timeout: 요청 타임아웃 (초)
             max_retries: 최대 재시도 횟수 (기본 3회)
             backoff_factor: 재시도 간격 계수 (기본 10초 - 2회차: 10초, 3회차: 20초)
+            pool_maxsize: 호스트별 커넥션 풀 크기 (병렬 요청 시 TCP 연결 재사용)
         """
         self.timeout = timeout
         self.max_retries = max_retries
@@ -230,14 +232,18 @@ class HTTPClient:
             total=max_retries,
             read=max_retries,
             connect=max_retries,
-            backoff_factor=10.0,  # 10초 백오프 (2회차: 10초, 3회차: 20초)
+            backoff_factor=backoff_factor,  # 기본 10초 백오프 (2회차: 10초, 3회차: 20초)
             status_forcelist=[429, 500, 502, 503, 504],  # 재시도할 HTTP 상태 코드
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],  # 재시도할 HTTP 메서드
             raise_on_redirect=False,  # 리다이렉트 시 예외 발생 안함
             raise_on_status=False     # 상태 코드 오류 시 예외 발생 안함 (우리가 직접 처리)
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
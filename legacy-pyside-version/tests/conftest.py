@@ -0,0 +1,7 @@
+"""
+pytest 공통 설정 (프로젝트 루트를 import 경로에 추가해 src 패키지를 절대 경로로 임포트)
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,39 @@
+"""
+블로그 구조 분석 기반 미디어 개수 집계 테스트
+"""
+from lxml import html as lxml_html
+
+from src.features.blog_automation.adapters import NaverBlogAdapter, _LXML_ADAPTER
+
+GIF_SRC = "https://example.com/anim.gif?type=w1"
+JPG_SRC = "https://example.com/photo.jpg"
+
+
+def _make_adapter() -> NaverBlogAdapter:
+    """브라우저 설정 없이 구조 분석 메서드만 쓰는 어댑터 인스턴스"""
+    return NaverBlogAdapter.__new__(NaverBlogAdapter)
+
+
+def _analyze_strip(adapter: NaverBlogAdapter, srcs: list) -> dict:
+    images = ''.join(f'<img src="{src}"/>' for src in srcs)
+    component = lxml_html.fragment_fromstring(
+        f'<div class="se-component se-imageStrip">{images}</div>'
+    )
+    classes = frozenset(_LXML_ADAPTER.classes(component))
+    return adapter._analyze_image_strip_component_unified(component, _LXML_ADAPTER, classes)
+
+
+def test_image_strip_keeps_repeated_srcs():
+    adapter = _make_adapter()
+    result = _analyze_strip(adapter, [GIF_SRC, GIF_SRC, JPG_SRC])
+
+    assert result['image_count'] == 3
+    assert result['image_urls'] == (GIF_SRC, GIF_SRC, JPG_SRC)
+
+
+def test_repeated_gif_srcs_in_strip_are_all_counted_as_gifs():
+    adapter = _make_adapter()
+    strip = _analyze_strip(adapter, [GIF_SRC, GIF_SRC, JPG_SRC])
+
+    # 같은 GIF src가 두 번 나와도 GIF 2개 + 정적 이미지 1개로 집계
+    assert adapter._count_media_from_structure([strip]) == (1, 2, 0)